@@ -6,18 +6,18 @@ Usage:
     python comic_viewer.py /path/to/comic.zip
 """
 
+import os
+import stat
 import sys
 import argparse
-import tkinter as tk
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+# GUI and imaging modules (tkinter, PIL) are imported where they are first
+# needed, so --help/--version and early error exits don't pay for them.
 from src import index_manager, state_manager, config_manager
-from src.image_cache import ImageCache
-from src.viewer_window import ViewerWindow
-from src.file_browser import FileBrowser
 
 
 def check_pillow_jp2_support():
@@ -35,9 +35,33 @@ def check_pillow_jp2_support():
         print("ERROR: Pillow is not installed.")
         print("Please install it: pip install Pillow")
         return False
+
+    # OpenJPEG (2.2+) decodes on multiple threads only when asked to via the
+    # environment; it reads the variable each time a decoder is created
+    os.environ.setdefault('OPJ_NUM_THREADS', str(os.cpu_count() or 4))
+
+    openjpeg_version = features.version('jpg_2000')
+    if openjpeg_version:
+        try:
+            major_minor = tuple(int(part) for part in openjpeg_version.split('.')[:2])
+        except ValueError:
+            major_minor = None
+        if major_minor is not None and major_minor < (2, 2):
+            print(f"Warning: OpenJPEG {openjpeg_version} does not support multithreaded decoding "
+                  "(2.2+ required), JPEG 2000 pages will decode more slowly.")
     return True
 
 
+def check_pillow_jpeg_turbo():
+    """Warn if Pillow's JPEG decoder isn't libjpeg-turbo (SIMD IDCT/Huffman)."""
+    from PIL import features
+
+    # None means Pillow was built without JPEG support at all
+    if features.check_feature('libjpeg_turbo') is False:
+        print("Warning: Pillow is not linked against libjpeg-turbo; JPEG pages will decode more slowly.")
+        print("Official Pillow wheels include it. For source builds, install libjpeg-turbo first.")
+
+
 def main():
     """Main entry point."""
     # Parse arguments
@@ -85,6 +109,11 @@ Index Files:
         nargs='?',
         help='Path to ZIP archive containing comic images (optional - opens file browser if not provided)'
     )
+    parser.add_argument(
+        '--verify',
+        action='store_true',
+        help='Also verify cached indexes against the archive contents (xxhash), not just mtime and size'
+    )
     parser.add_argument(
         '--version',
         action='version',
@@ -93,14 +122,12 @@ Index Files:
 
     args = parser.parse_args()
 
-    # Check Pillow JPEG 2000 support once at startup
-    if not check_pillow_jp2_support():
-        return 1
-
     # Determine initial archive path
     if args.archive:
-        # Direct launch: use provided argument (highest priority)
-        archive_path = args.archive.resolve()
+        # Direct launch: use provided argument (highest priority).
+        # abspath is pure string math - no symlink resolution syscalls here;
+        # index/state/config keys canonicalize the path themselves.
+        archive_path = Path(os.path.abspath(args.archive))
     else:
         # No CLI argument: check last opened file, then fall back to browser
         config = config_manager.load_config()
@@ -130,6 +157,7 @@ Index Files:
                 start_dir = Path.cwd()
 
             # Show file browser (no parent needed)
+            from src.file_browser import FileBrowser
             browser = FileBrowser(None, start_dir)
             selected_file = browser.show()
 
@@ -142,40 +170,49 @@ Index Files:
             # Remember the directory for next time
             config_manager.update_last_browsed_directory(archive_path.parent)
 
+    # Check Pillow JPEG 2000 support once, before the first file is opened
+    if not check_pillow_jp2_support():
+        return 1
+    check_pillow_jpeg_turbo()
+
+    from src.image_cache import ImageCache
+    from src.viewer_window import ViewerWindow
+
     # Main viewing loop - allows switching between files
     while True:
-        # Verify archive exists
-        if not archive_path.exists():
+        # Verify archive exists (one stat call covers existence, type and size)
+        try:
+            archive_stat = archive_path.stat()
+        except OSError:
             print(f"ERROR: Archive not found: {archive_path}")
             return 1
 
-        if not archive_path.is_file():
+        if not stat.S_ISREG(archive_stat.st_mode):
             print(f"ERROR: Not a file: {archive_path}")
             return 1
 
         print(f"Opening: {archive_path.name}")
-        print(f"Size: {archive_path.stat().st_size / (1024*1024):.2f} MB")
+        print(f"Size: {archive_stat.st_size / (1024*1024):.2f} MB")
 
         try:
             # Load or create index
-            index_data = index_manager.load_or_create_index(archive_path)
+            index_data = index_manager.load_or_create_index(archive_path, verify=args.verify)
             print(f"Pages: {index_data['total_pages']}")
 
             # Save as last opened file (after successful validation)
             config_manager.update_last_opened_file(archive_path)
 
-            # Initialize image cache
-            image_cache = ImageCache(archive_path, index_data, max_cache_size=5)
-
             # Load last read page if available
             initial_page = state_manager.load_state(archive_path)
             if initial_page is None or initial_page >= index_data['total_pages']:
                 initial_page = 0
 
-            # Create and run viewer window
-            viewer = ViewerWindow(archive_path, index_data, image_cache, initial_page=initial_page)
-            print("Launching viewer... (press 'q' to quit, 'o' to open another file)")
-            next_file = viewer.run()
+            # Initialize image cache (closed when the viewer exits)
+            with ImageCache(archive_path, index_data, max_cache_size=5) as image_cache:
+                # Create and run viewer window
+                viewer = ViewerWindow(archive_path, index_data, image_cache, initial_page=initial_page)
+                print("Launching viewer... (press 'q' to quit, 'o' to open another file)")
+                next_file = viewer.run()
 
             # Check if user wants to open another file
             if next_file:
@@ -185,6 +222,7 @@ Index Files:
             else:
                 # User quit normally, exit loop
                 print("Closing viewer...")
+                config_manager.flush_config()
                 return 0
 
         except ValueError as e:
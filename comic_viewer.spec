@@ -27,7 +27,6 @@ a = Analysis(
         'PIL.ImageDraw',
         'PIL.ImageFont',
         'PIL.Jpeg2KImagePlugin',  # JPEG 2000 support
-        'natsort',
         'xxhash',
         'xdg_base_dirs',
     ],
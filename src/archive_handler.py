@@ -1,16 +1,31 @@
 """Archive handling for ZIP files containing comic images."""
 
+import mmap
 import os
+import re
+import struct
+import threading
 import zipfile
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
-from PIL import Image
-import natsort
+from typing import List, Dict, Any, Optional, Tuple, Union
 
 
 # Supported image extensions (prioritize .jp2, but support others for compatibility)
-IMAGE_EXTENSIONS = {'.jp2', '.jpeg', '.jpg', '.png', '.gif', '.webp', '.bmp'}
+IMAGE_EXTENSIONS = frozenset({'.jp2', '.jpeg', '.jpg', '.png', '.gif', '.webp', '.bmp'})
+
+# Splits filenames into text and digit runs for natural sorting
+_NUM_RE = re.compile(r'(\d+)')
+
+# JPEG 2000 header signatures
+JP2_SIGNATURE = b'\x00\x00\x00\x0cjP  \r\n\x87\n'  # JP2 container signature box
+J2K_SOC_SIZ = b'\xff\x4f\xff\x51'  # Raw codestream: SOC marker followed by SIZ
+
+# Bytes read when probing JPEG 2000 headers (ihdr/SIZ sit well inside this)
+JP2_HEADER_PROBE_SIZE = 512
+
+# Upper bound on threads used when building a page index
+MAX_INDEX_WORKERS = 8
 
 
 def validate_archive_path(archive_path: str) -> bool:
@@ -23,10 +38,37 @@ def validate_archive_path(archive_path: str) -> bool:
     return not normalized.startswith('..') and not os.path.isabs(normalized)
 
 
-def open_archive(archive_path: Path) -> zipfile.ZipFile:
+class _MappedFile(mmap.mmap):
+    """Read-only memory map that ZipFile can use as its file object."""
+
+    def seekable(self) -> bool:
+        # zipfile checks seekable(), which mmap only provides from Python 3.13
+        return True
+
+
+def map_archive(archive_path: Path) -> _MappedFile:
+    """
+    Memory-map an archive file read-only.
+
+    Reads through the map are served straight from the page cache, with
+    no per-read syscalls or buffered-IO copies.
+    """
+    try:
+        with open(archive_path, 'rb') as f:
+            # The map keeps its own file descriptor, so f can be closed
+            return _MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Archive not found: {archive_path}")
+    except ValueError:
+        # mmap refuses zero-length files
+        raise ValueError("Invalid or corrupted ZIP file: file is empty")
+
+
+def open_archive(archive_path: Union[Path, _MappedFile]) -> zipfile.ZipFile:
     """
     Open ZIP archive for reading.
 
+    Accepts a path or a mapping from map_archive().
     Returns a ZipFile object (use with context manager).
     """
     try:
@@ -51,7 +93,10 @@ def list_image_files(zip_file: zipfile.ZipFile) -> List[str]:
             continue
 
         filename = file_info.filename
-        ext = Path(filename).suffix.lower()
+        dot = filename.rfind('.')
+        if dot < 0:
+            continue
+        ext = filename[dot:].lower()
 
         # Check if it's an image file
         if ext in IMAGE_EXTENSIONS:
@@ -75,27 +120,73 @@ def natural_sort_pages(filenames: List[str]) -> List[str]:
         page1.jp2, page2.jp2, page10.jp2 (not page1, page10, page2)
         001.jp2, 002.jp2, 010.jp2
     """
-    return natsort.natsorted(filenames)
+    return sorted(filenames, key=_nat_key)
+
+
+def _nat_key(filename: str) -> tuple:
+    """Sort key that compares digit runs numerically (computed once per name)."""
+    # split() with a capturing group puts the digit runs at the odd indices
+    parts = _NUM_RE.split(filename.lower())
+    parts[1::2] = map(int, parts[1::2])
+    return tuple(parts)
+
+
+def _parse_jp2_dimensions(head: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Parse width/height from the start of a JPEG 2000 file.
+
+    Reads the ihdr box of a JP2 container or the SIZ marker of a raw
+    codestream, so no image data has to be decoded.
+
+    Returns (width, height), or None if the header isn't recognised.
+    """
+    if head.startswith(JP2_SIGNATURE):
+        # ihdr box payload: HEIGHT (u32), WIDTH (u32), ...
+        pos = head.find(b'ihdr')
+        if pos < 0 or pos + 12 > len(head):
+            return None
+        height, width = struct.unpack_from('>II', head, pos + 4)
+        return width, height
+
+    if head.startswith(J2K_SOC_SIZ):
+        # SIZ segment: Lsiz (u16), Rsiz (u16), Xsiz, Ysiz, XOsiz, YOsiz (u32 each)
+        if len(head) < 24:
+            return None
+        xsiz, ysiz, xosiz, yosiz = struct.unpack_from('>IIII', head, 8)
+        return xsiz - xosiz, ysiz - yosiz
+
+    return None
 
 
 def get_page_info(zip_file: zipfile.ZipFile, page_path: str) -> Dict[str, Any]:
     """
     Extract metadata for a single page.
 
-    Returns dict with: filename, archive_path, size, compressed_size,
-    format, width, height.
+    Returns dict with: filename, archive_path, header_offset, size,
+    compressed_size, format, width, height.
     """
+    from PIL import Image
+
     try:
         file_info = zip_file.getinfo(page_path)
     except KeyError:
         raise ValueError(f"Page not found in archive: {page_path}")
 
-    # Extract image to get dimensions and format
+    # Read dimensions from the image header (no full decode). The entry is
+    # streamed, so only the bytes the header parser touches get decompressed.
+    # Open by ZipInfo so the name isn't looked up a second time.
     try:
-        image_data = zip_file.read(page_path)
-        with Image.open(BytesIO(image_data)) as img:
-            width, height = img.size
-            img_format = img.format if img.format else 'UNKNOWN'
+        with zip_file.open(file_info) as fp:
+            dimensions = _parse_jp2_dimensions(fp.read(JP2_HEADER_PROBE_SIZE))
+            if dimensions:
+                width, height = dimensions
+                img_format = 'JPEG2000'
+            else:
+                # Other formats: PIL's open is lazy and only parses the header
+                fp.seek(0)
+                with Image.open(fp) as img:
+                    width, height = img.size
+                    img_format = img.format if img.format else 'UNKNOWN'
     except Exception as e:
         # Fallback if image can't be opened
         print(f"Warning: Could not read image metadata for {page_path}: {e}")
@@ -105,6 +196,7 @@ def get_page_info(zip_file: zipfile.ZipFile, page_path: str) -> Dict[str, Any]:
     return {
         'filename': Path(page_path).name,
         'archive_path': page_path,
+        'header_offset': file_info.header_offset,
         'size': file_info.file_size,
         'compressed_size': file_info.compress_size,
         'format': img_format,
@@ -113,6 +205,40 @@ def get_page_info(zip_file: zipfile.ZipFile, page_path: str) -> Dict[str, Any]:
     }
 
 
+def build_page_index(archive_path: Path, filenames: List[str], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Extract metadata for many pages in parallel.
+
+    Each worker thread opens its own ZipFile handle. Sharing one would be
+    safe - ZipFile serialises reads through a handle with an internal lock,
+    which is what ImageCache's preload workers rely on - but separate
+    handles keep the workers from contending on that lock. Results keep
+    the input order.
+    """
+    if workers is None:
+        workers = min(MAX_INDEX_WORKERS, os.cpu_count() or 1)
+
+    local = threading.local()
+    sessions = []
+    sessions_lock = threading.Lock()
+
+    def worker(page_path: str) -> Dict[str, Any]:
+        session = getattr(local, 'session', None)
+        if session is None:
+            session = ArchiveSession(archive_path)
+            local.session = session
+            with sessions_lock:
+                sessions.append(session)
+        return session.get_page_info(page_path)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(worker, filenames))
+    finally:
+        for session in sessions:
+            session.close()
+
+
 def extract_page_to_memory(zip_file: zipfile.ZipFile, page_path: str) -> bytes:
     """
     Extract a single page to memory.
@@ -125,3 +251,79 @@ def extract_page_to_memory(zip_file: zipfile.ZipFile, page_path: str) -> bytes:
         raise ValueError(f"Page not found in archive: {page_path}")
     except Exception as e:
         raise RuntimeError(f"Failed to extract page {page_path}: {e}")
+
+
+class ArchiveSession:
+    """
+    Long-lived handle on a ZIP archive.
+
+    Memory-maps the archive and parses its central directory once; listing,
+    metadata and page extraction all reuse the same ZipFile. Use as a
+    context manager or call close() when done.
+    """
+
+    def __init__(self, archive_path: Path):
+        """
+        Open archive session.
+
+        Args:
+            archive_path: Path to the ZIP archive
+        """
+        self.archive_path = Path(archive_path)
+        self.mapped_file = map_archive(self.archive_path)
+        try:
+            self.zip_file = open_archive(self.mapped_file)
+        except Exception:
+            self.mapped_file.close()
+            raise
+
+    def __enter__(self) -> 'ArchiveSession':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying ZipFile and memory map."""
+        self.zip_file.close()
+        self.mapped_file.close()
+
+    def list_image_files(self) -> List[str]:
+        """List all image files in the archive."""
+        return list_image_files(self.zip_file)
+
+    def get_page_info(self, page_path: str) -> Dict[str, Any]:
+        """Extract metadata for a single page."""
+        return get_page_info(self.zip_file, page_path)
+
+    def extract_page(self, page_path: str) -> bytes:
+        """Extract a single page to memory."""
+        return extract_page_to_memory(self.zip_file, page_path)
+
+    def prefetch(self, page_paths: List[str]):
+        """
+        Ask the kernel to start reading pages' compressed data in the background.
+
+        Issues one madvise(WILLNEED) per page on the archive mapping so
+        upcoming reads are served from the page cache. Non-blocking; a
+        no-op where madvise isn't available.
+        """
+        if not hasattr(mmap, 'MADV_WILLNEED'):
+            return
+
+        map_size = len(self.mapped_file)
+        for page_path in page_paths:
+            try:
+                info = self.zip_file.getinfo(page_path)
+            except KeyError:
+                continue
+            # Local file header + name + extra field, then the compressed data
+            length = (zipfile.sizeFileHeader + len(info.filename.encode('utf-8'))
+                      + len(info.extra) + info.compress_size)
+            # madvise needs a page-aligned start
+            start = info.header_offset - info.header_offset % mmap.PAGESIZE
+            end = min(info.header_offset + length, map_size)
+            try:
+                self.mapped_file.madvise(mmap.MADV_WILLNEED, start, end - start)
+            except (OSError, ValueError):
+                return
@@ -1,10 +1,23 @@
 """Configuration management for comic viewer."""
 
 import json
+import threading
 from pathlib import Path
 from typing import Optional
 from xdg_base_dirs import xdg_config_home
 
+from . import json_io
+
+
+# Delay before pending config updates are written to disk (seconds)
+CONFIG_FLUSH_DELAY = 1.0
+
+# In-memory copy of the config, loaded from disk on first use
+_config_cache: Optional[dict] = None
+_config_dirty = False
+_flush_timer: Optional[threading.Timer] = None
+_config_lock = threading.RLock()
+
 
 def get_config_dir() -> Path:
     """
@@ -36,13 +49,24 @@ def get_config_path() -> Path:
 
 def load_config() -> dict:
     """
-    Load configuration from file.
+    Load configuration.
 
+    Reads the config file on first call and serves later calls from memory.
     Returns default config if file doesn't exist or is invalid.
 
     Returns:
         dict with keys: version, last_browsed_directory, last_opened_file
     """
+    global _config_cache
+
+    with _config_lock:
+        if _config_cache is None:
+            _config_cache = _read_config_file()
+        return dict(_config_cache)
+
+
+def _read_config_file() -> dict:
+    """Read configuration from disk, falling back to defaults."""
     config_path = get_config_path()
 
     # Default configuration
@@ -58,8 +82,7 @@ def load_config() -> dict:
 
     # Try to load config file
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
+        config_data = json_io.read_json(config_path)
     except json.JSONDecodeError as e:
         print(f"Warning: Corrupted config file, using defaults: {e}")
         return default_config
@@ -88,18 +111,57 @@ def save_config(config: dict) -> None:
 
     Silent error handling - failures are logged but don't raise exceptions.
     """
+    global _config_cache, _config_dirty
+
     config_path = get_config_path()
 
     # Ensure version is set
     if 'version' not in config:
         config['version'] = '1.0'
 
-    # Write config file
-    try:
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2)
-    except OSError as e:
-        print(f"Warning: Could not save config: {e}")
+    # Lock held while writing so a deferred flush can't interleave with us
+    with _config_lock:
+        _config_cache = dict(config)
+        _config_dirty = False
+
+        # Write config file (atomic replace)
+        try:
+            json_io.write_json(config_path, config)
+        except OSError as e:
+            print(f"Warning: Could not save config: {e}")
+
+
+def flush_config() -> None:
+    """Write pending config updates to disk now."""
+    global _flush_timer
+
+    with _config_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        if _config_dirty:
+            save_config(dict(_config_cache))
+
+
+def _update_config(key: str, value) -> None:
+    """
+    Set a config value in memory and schedule a deferred write.
+
+    Bursts of updates (e.g. directory + file on every file switch) are
+    written once, CONFIG_FLUSH_DELAY seconds after the last one.
+    """
+    global _config_dirty, _flush_timer
+
+    load_config()  # Make sure the cache is populated
+
+    with _config_lock:
+        _config_cache[key] = value
+        _config_dirty = True
+
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+        _flush_timer = threading.Timer(CONFIG_FLUSH_DELAY, flush_config)
+        _flush_timer.start()
 
 
 def update_last_browsed_directory(directory: Path) -> None:
@@ -109,17 +171,10 @@ def update_last_browsed_directory(directory: Path) -> None:
     Args:
         directory: Path to directory to remember
 
-    This is a convenience function that loads the config, updates the
-    last_browsed_directory field, and saves it back.
+    The change is kept in memory and written to disk shortly afterwards
+    (see flush_config).
     """
-    # Load current config
-    config = load_config()
-
-    # Update last browsed directory
-    config['last_browsed_directory'] = str(directory.resolve())
-
-    # Save updated config
-    save_config(config)
+    _update_config('last_browsed_directory', str(directory.resolve()))
 
 
 def update_last_opened_file(file_path: Path) -> None:
@@ -129,14 +184,8 @@ def update_last_opened_file(file_path: Path) -> None:
     Args:
         file_path: Path to file to remember
 
-    This is a convenience function that loads the config, updates the
-    last_opened_file field, and saves it back.
+    The change is kept in memory and written to disk shortly afterwards
+    (see flush_config).
     """
-    # Load current config
-    config = load_config()
-
-    # Update last opened file (convert to absolute path string)
-    config['last_opened_file'] = str(file_path.resolve())
-
-    # Save updated config
-    save_config(config)
+    # Store as absolute path string
+    _update_config('last_opened_file', str(file_path.resolve()))
@@ -1,11 +1,16 @@
 """File browser dialog for selecting comic archives."""
 
+import os
 import tkinter as tk
-from tkinter import font as tkfont
 from pathlib import Path
 from typing import Optional
 
 
+# Fixed size of the browser dialog
+DIALOG_WIDTH = 900
+DIALOG_HEIGHT = 700
+
+
 def is_comic_file(filename: str) -> bool:
     """
     Check if filename matches comic file pattern.
@@ -14,10 +19,13 @@ def is_comic_file(filename: str) -> bool:
         filename: Name of file to check
 
     Returns:
-        True if file is a CBZ archive or contains "jp2" in name
+        True if file is a CBZ archive, or a ZIP archive with "jp2" in its
+        name (e.g. archive.org's "<name>_jp2.zip" downloads)
     """
     filename_lower = filename.lower()
-    return filename_lower.endswith('.cbz') or 'jp2' in filename_lower
+    if filename_lower.endswith('.cbz'):
+        return True
+    return filename_lower.endswith('.zip') and 'jp2' in filename_lower
 
 
 class FileBrowser:
@@ -37,7 +45,8 @@ class FileBrowser:
             initial_directory: Directory to start browsing in
         """
         self.parent = parent
-        self.current_directory = initial_directory.resolve()
+        # Lexically normalized absolute path (no per-component realpath syscalls)
+        self.current_directory = Path(os.path.abspath(initial_directory))
         self.selected_file = None
 
         # Create modal dialog
@@ -51,7 +60,6 @@ class FileBrowser:
             self.dialog.grab_set()
 
         self.dialog.title("Select Comic Archive")
-        self.dialog.geometry("900x700")
         self.dialog.configure(bg='#2b2b2b')
 
         # Create UI components
@@ -63,7 +71,7 @@ class FileBrowser:
         # Populate initial file list
         self._populate_list()
 
-        # Center window
+        # Size and center window
         self._center_window()
 
     def _create_ui(self):
@@ -174,9 +182,11 @@ class FileBrowser:
         # Update directory label
         self.dir_label.config(text=str(self.current_directory))
 
-        # Get list of items in directory
+        # Get list of items in directory. scandir reports entry types from
+        # the directory listing itself, so most entries need no stat call.
         try:
-            items = list(self.current_directory.iterdir())
+            with os.scandir(self.current_directory) as it:
+                entries = list(it)
         except PermissionError:
             self.listbox.insert(tk.END, "  [Permission Denied]")
             self.item_paths.append(None)
@@ -190,12 +200,12 @@ class FileBrowser:
         directories = []
         files = []
 
-        for item in items:
+        for entry in entries:
             try:
-                if item.is_dir():
-                    directories.append(item)
-                elif item.is_file() and is_comic_file(item.name):
-                    files.append(item)
+                if entry.is_dir():
+                    directories.append(Path(entry.path))
+                elif is_comic_file(entry.name) and entry.is_file():
+                    files.append(Path(entry.path))
             except (PermissionError, OSError):
                 # Skip items we can't access
                 continue
@@ -204,41 +214,34 @@ class FileBrowser:
         directories.sort(key=lambda p: p.name.lower())
         files.sort(key=lambda p: p.name.lower())
 
+        # Build display names first, then insert them in one Tcl call
+        display_names = []
+
         # Add parent directory entry if not at root
         if self.current_directory.parent != self.current_directory:
-            self.listbox.insert(tk.END, "  ..")
+            display_names.append("  ..")
             self.item_paths.append(self.current_directory.parent)
-            # Style parent entry as directory
-            self.listbox.itemconfig(0, fg='#00ffff')
-            try:
-                bold_font = tkfont.Font(font=self.listbox['font'])
-                bold_font.config(weight='bold')
-                self.listbox.itemconfig(0, font=bold_font)
-            except:
-                pass  # Fallback if font styling fails
 
         # Add directories
         for directory in directories:
-            display_name = f"  {directory.name}/"
-            index = self.listbox.size()
-            self.listbox.insert(tk.END, display_name)
+            display_names.append(f"  {directory.name}/")
             self.item_paths.append(directory)
-            # Style as directory: cyan and bold
-            self.listbox.itemconfig(index, fg='#00ffff')
-            try:
-                bold_font = tkfont.Font(font=self.listbox['font'])
-                bold_font.config(weight='bold')
-                self.listbox.itemconfig(index, font=bold_font)
-            except:
-                pass  # Fallback if font styling fails
+
+        # Directory entries (including "..") come first in the list
+        directory_count = len(display_names)
 
         # Add files
         for file in files:
-            display_name = f"  {file.name}"
-            index = self.listbox.size()
-            self.listbox.insert(tk.END, display_name)
+            display_names.append(f"  {file.name}")
             self.item_paths.append(file)
-            # Files stay white (default)
+
+        if display_names:
+            self.listbox.insert(tk.END, *display_names)
+
+        # Style directories (Listbox items only support colours, not
+        # per-item fonts); files stay white (default)
+        for index in range(directory_count):
+            self.listbox.itemconfig(index, fg='#00ffff')
 
         # Select first item if list is not empty
         if self.listbox.size() > 0:
@@ -346,7 +349,9 @@ class FileBrowser:
         try:
             # Verify directory exists and is accessible
             if directory.exists() and directory.is_dir():
-                self.current_directory = directory.resolve()
+                # Entries are built from the (already absolute) current
+                # directory, so no resolve() is needed here
+                self.current_directory = directory
                 self._populate_list()
             else:
                 print(f"Warning: Cannot access directory: {directory}")
@@ -359,12 +364,13 @@ class FileBrowser:
         self.dialog.destroy()
 
     def _center_window(self):
-        """Center dialog on screen."""
-        self.dialog.update_idletasks()
+        """
+        Size dialog and center it on screen.
 
-        # Get window and screen dimensions
-        window_width = self.dialog.winfo_width()
-        window_height = self.dialog.winfo_height()
+        The dialog size is fixed, so the position is computed up front and set
+        with a single geometry call - no update_idletasks() layout pass.
+        """
+        window_width, window_height = DIALOG_WIDTH, DIALOG_HEIGHT
         screen_width = self.dialog.winfo_screenwidth()
         screen_height = self.dialog.winfo_screenheight()
 
@@ -372,7 +378,7 @@ class FileBrowser:
         x = (screen_width - window_width) // 2
         y = (screen_height - window_height) // 2
 
-        self.dialog.geometry(f"+{x}+{y}")
+        self.dialog.geometry(f"{window_width}x{window_height}+{x}+{y}")
 
     def show(self) -> Optional[Path]:
         """
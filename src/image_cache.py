@@ -1,105 +1,224 @@
 """Image caching and loading for comic viewer."""
 
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 import threading
-import zipfile
 from PIL import Image
 
-from . import archive_handler
+from . import archive_handler, index_manager
+
+
+# Modes decoded pages are kept in; anything else is converted to RGB on load
+RESAMPLE_MODES = ('RGB', 'RGBA', 'L', 'LA')
+
+# Viewer canvas colour that transparent pages are composited onto
+DISPLAY_BACKGROUND = (0x2b, 0x2b, 0x2b)
 
 
 class ImageCache:
     """
-    LRU cache for decoded images with preloading support.
+    Two-level LRU page cache with preloading support.
 
-    Keeps recently viewed pages in memory for instant navigation.
+    Keeps the compressed bytes of recently viewed pages (small, decoded on
+    demand) plus a few pages already scaled for display, so navigation and
+    redraws at an unchanged window size are instant.
     """
 
-    def __init__(self, archive_path: Path, index_data: Dict, max_cache_size: int = 5):
+    PRELOAD_WORKERS = 2
+    REDUCING_GAP = 2.0  # Pillow resize() reducing_gap for downscales below 50%
+
+    def __init__(self, archive_path: Path, index_data: Dict, max_cache_size: int = 5,
+                 readahead_pages: int = 3, max_scaled_cache_size: int = 4,
+                 preload_pages: int = 3):
         """
         Initialize image cache.
 
         Args:
             archive_path: Path to the ZIP archive
             index_data: Index data with page information
-            max_cache_size: Maximum number of images to keep in cache
+            max_cache_size: Maximum number of compressed pages to keep in cache
+            readahead_pages: Number of upcoming pages to ask the OS to read ahead
+            max_scaled_cache_size: Maximum number of display-scaled images to keep
+            preload_pages: Number of upcoming pages to load in the background
         """
         self.archive_path = Path(archive_path)
         self.index_data = index_data
+        self._page_paths = index_manager.page_column(index_data, 'archive_path')
         self.max_cache_size = max_cache_size
+        self.readahead_pages = readahead_pages
+        self.max_scaled_cache_size = max_scaled_cache_size
+        self.preload_pages = preload_pages
+        self._closed = False
+
+        # LRU caches, least recently used first:
+        # {page_index: compressed bytes} and
+        # {(page_index, window_width, window_height, mode): scaled PIL.Image}
+        self.cache: 'OrderedDict[int, bytes]' = OrderedDict()
+        self.scaled_cache: 'OrderedDict[Tuple[int, int, int, str], Image.Image]' = OrderedDict()
+        self.cache_lock = threading.Lock()  # Shared with the preload workers
+
+        # Open archive once for the whole viewing session
+        self.session = archive_handler.ArchiveSession(archive_path)
+
+        # Persistent preload pool; pages being loaded are tracked in
+        # _inflight (guarded by cache_lock) so they are never submitted twice
+        self._executor = ThreadPoolExecutor(max_workers=self.PRELOAD_WORKERS,
+                                            thread_name_prefix='preload')
+        self._inflight: Dict[int, Future] = {}
+
+    def __enter__(self) -> 'ImageCache':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Stop the preload workers and release cached pages and the archive.
 
-        # LRU cache: {page_index: PIL.Image}
-        self.cache: Dict[int, Image.Image] = {}
-        self.access_order: list = []  # Track access order for LRU
-
-        # Preload thread management
-        self.preload_thread: Optional[threading.Thread] = None
-        self.preload_cancel = threading.Event()
-
-        # Open ZIP file (keep it open for performance)
-        self.zip_file = archive_handler.open_archive(archive_path)
+        Call this (or use the cache as a context manager) when done with the
+        archive; cleanup isn't left to garbage collection. Safe to call twice.
+        """
+        if self._closed:
+            return
+        self._closed = True
 
-    def __del__(self):
-        """Clean up resources."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
         self.clear_cache()
-        if hasattr(self, 'zip_file'):
-            self.zip_file.close()
+        self.session.close()
 
     def get_page(self, page_index: int) -> Image.Image:
         """
-        Get page image by index.
+        Get full-resolution page image by index.
 
-        Returns cached image if available, otherwise loads from archive.
+        Uses cached compressed bytes if available, otherwise reads them from
+        the archive. The image is decoded on every call.
         """
         if page_index < 0 or page_index >= self.index_data['total_pages']:
             raise ValueError(f"Invalid page index: {page_index}")
 
-        # Check cache
-        if page_index in self.cache:
-            # Move to end of access order (most recently used)
-            self.access_order.remove(page_index)
-            self.access_order.append(page_index)
-            return self.cache[page_index]
+        return self._decode(self._get_page_data(page_index))
 
-        # Load from archive
-        image = self._load_page(page_index)
+    def get_scaled_page(self, page_index: int, mode: str,
+                        window_size: Tuple[int, int]) -> Image.Image:
+        """
+        Get page image scaled for display.
 
-        # Add to cache
-        self._add_to_cache(page_index, image)
+        Args:
+            page_index: Zero-based page index
+            mode: 'fit-width', 'fit-height', or 'actual'
+            window_size: (width, height) of display area
 
-        return image
+        Returns:
+            Scaled PIL Image (shared with the cache - don't modify it)
+        """
+        if page_index < 0 or page_index >= self.index_data['total_pages']:
+            raise ValueError(f"Invalid page index: {page_index}")
+
+        key = self._scaled_key(page_index, mode, window_size)
+        with self.cache_lock:
+            if key in self.scaled_cache:
+                self.scaled_cache.move_to_end(key)
+                return self.scaled_cache[key]
+
+        # Decode at a reduced resolution where the format allows it - the
+        # page is about to be scaled down anyway
+        image = self._decode(self._get_page_data(page_index), mode, window_size)
 
-    def _load_page(self, page_index: int) -> Image.Image:
-        """Load page from archive."""
-        page_info = self.index_data['pages'][page_index]
-        archive_path = page_info['archive_path']
+        scaled = self.scale_image(image, mode, window_size)
+        self._add_to_cache(self.scaled_cache, key, scaled, self.max_scaled_cache_size)
+        return scaled
 
-        # Extract to memory
-        image_data = archive_handler.extract_page_to_memory(self.zip_file, archive_path)
+    @staticmethod
+    def _scaled_key(page_index: int, mode: str,
+                    window_size: Tuple[int, int]) -> Tuple[int, int, int, str]:
+        """Build the scaled cache key (actual size ignores the window)."""
+        if mode == 'actual':
+            return (page_index, 0, 0, mode)
+        return (page_index, window_size[0], window_size[1], mode)
+
+    def _get_page_data(self, page_index: int) -> bytes:
+        """Get compressed page bytes from the cache or the archive."""
+        with self.cache_lock:
+            if page_index in self.cache:
+                # Move to end (most recently used)
+                self.cache.move_to_end(page_index)
+                return self.cache[page_index]
+
+        data = self._load_page(page_index)
+        self._add_to_cache(self.cache, page_index, data, self.max_cache_size)
+        return data
+
+    def _load_page(self, page_index: int) -> bytes:
+        """Read a page's compressed image bytes from the archive."""
+        return self.session.extract_page(self._page_paths[page_index])
+
+    def _decode(self, image_data: bytes, mode: Optional[str] = None,
+                window_size: Optional[Tuple[int, int]] = None) -> Image.Image:
+        """
+        Fully decode compressed image bytes.
 
-        # Open with PIL
+        Decoding happens here rather than lazily on first pixel access, so
+        when called from a preload worker the decode cost stays off the
+        UI thread (Pillow releases the GIL while decoding).
+
+        Args:
+            image_data: Compressed image bytes
+            mode: Viewing mode the image will be scaled for (None = full size)
+            window_size: (width, height) of display area, needed with mode
+
+        Returns:
+            Decoded PIL Image. With a fit mode, JPEG and JPEG 2000 pages are
+            decoded at the smallest power-of-two reduction that is still at
+            least as large as the display size.
+        """
         image = Image.open(BytesIO(image_data))
 
-        # Convert to RGB if necessary (for consistent handling)
-        if image.mode not in ('RGB', 'RGBA'):
+        target_size = None
+        if mode is not None:
+            target_size = self._fit_size(image.size, mode, window_size)
+
+        if target_size is not None:
+            if image.format == 'JPEG':
+                # libjpeg scales by 1/2, 1/4 or 1/8 during DCT decoding
+                image.draft(None, target_size)
+            elif image.format == 'JPEG2000':
+                # OpenJPEG skips the finest resolution levels
+                image.reduce = self._reduce_factor(image.size, target_size)
+
+        try:
+            image.load()
+        except OSError:
+            if target_size is None:
+                raise
+            # E.g. fewer resolution levels in the codestream than requested
+            image = Image.open(BytesIO(image_data))
+            image.load()
+
+        # Convert modes that can't be resampled smoothly (Pillow resizes
+        # palette and bilevel images with NEAREST). Grayscale stays as is
+        # and is converted after scaling, on far fewer pixels.
+        if image.mode not in RESAMPLE_MODES:
             image = image.convert('RGB')
 
         return image
 
-    def _add_to_cache(self, page_index: int, image: Image.Image):
-        """Add image to cache with LRU eviction."""
-        # Evict oldest if cache is full
-        while len(self.cache) >= self.max_cache_size:
-            oldest = self.access_order.pop(0)
-            if oldest in self.cache:
-                self.cache[oldest].close()
-                del self.cache[oldest]
+    def _add_to_cache(self, cache: OrderedDict, key, value, max_size: int):
+        """Add a value to one of the LRU caches, evicting the oldest entries."""
+        with self.cache_lock:
+            # Replacing an entry (e.g. loaded by both threads); an evicted
+            # image may still be in use by a caller, so just drop references
+            cache.pop(key, None)
 
-        # Add new image
-        self.cache[page_index] = image
-        self.access_order.append(page_index)
+            # Evict oldest if cache is full
+            while cache and len(cache) >= max_size:
+                cache.popitem(last=False)
+
+            # Add new entry (most recently used)
+            cache[key] = value
 
     def scale_image(self, image: Image.Image, mode: str, window_size: Tuple[int, int]) -> Image.Image:
         """
@@ -113,75 +232,151 @@ class ImageCache:
         Returns:
             Scaled PIL Image
         """
+        new_size = self._fit_size(image.size, mode, window_size)
+        if new_size is None:
+            return self.to_display_mode(image)
+        new_width, new_height = new_size
+        scale = new_width / image.width
+
+        # Use high-quality resampling. For large downscales, let Pillow
+        # box-reduce by an integer factor first, then LANCZOS the remainder
+        # (same quality, far less work than one wide-kernel pass)
+        reducing_gap = self.REDUCING_GAP if scale < 0.5 else None
+        scaled = image.resize((new_width, new_height), Image.Resampling.LANCZOS,
+                              reducing_gap=reducing_gap)
+        return self.to_display_mode(scaled)
+
+    @staticmethod
+    def _fit_size(image_size: Tuple[int, int], mode: str,
+                  window_size: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """
+        Compute the display size of an image for a viewing mode.
+
+        Returns:
+            (width, height), or None to display the image unscaled
+        """
         if mode == 'actual':
-            return image
+            return None
 
         window_width, window_height = window_size
-        img_width, img_height = image.size
+        img_width, img_height = image_size
 
-        if mode == 'fit-width':
-            # Scale to fit width, maintain aspect ratio
-            scale = window_width / img_width
-            new_width = window_width
-            new_height = int(img_height * scale)
-        elif mode == 'fit-height':
+        if mode == 'fit-height':
             # Scale to fit height, maintain aspect ratio
             scale = window_height / img_height
             new_width = int(img_width * scale)
             new_height = window_height
         else:
-            # Default to fit-width
+            # Scale to fit width (the default), maintain aspect ratio
             scale = window_width / img_width
             new_width = window_width
             new_height = int(img_height * scale)
 
-        # Only scale down or if scale factor is reasonable
+        # Only scale if the result is a valid size
         if new_width <= 0 or new_height <= 0:
-            return image
-
-        # Use high-quality resampling
-        return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-    def preload_adjacent(self, current_index: int):
+            return None
+
+        return new_width, new_height
+
+    @staticmethod
+    def _reduce_factor(image_size: Tuple[int, int], target_size: Tuple[int, int]) -> int:
+        """Largest n for which the image halved n times still covers target_size."""
+        reduce = 0
+        width, height = image_size
+        while width // 2 >= target_size[0] and height // 2 >= target_size[1]:
+            width //= 2
+            height //= 2
+            reduce += 1
+        return reduce
+
+    @staticmethod
+    def to_display_mode(image: Image.Image) -> Image.Image:
         """
-        Preload next page in background.
+        Prepare a scaled image for conversion to a Tk PhotoImage.
 
-        Cancels any existing preload operation.
+        Transparent images are composited onto the viewer background once
+        here, so PhotoImage doesn't have to blend alpha per pixel. RGB and
+        grayscale images are returned as is; other modes become RGB.
         """
-        # Cancel existing preload
-        if self.preload_thread and self.preload_thread.is_alive():
-            self.preload_cancel.set()
-            self.preload_thread.join(timeout=0.1)
-
-        # Reset cancel flag
-        self.preload_cancel.clear()
+        if image.mode in ('RGBA', 'LA'):
+            background = Image.new('RGB', image.size, DISPLAY_BACKGROUND)
+            background.paste(image, mask=image.getchannel('A'))
+            return background
+        if image.mode not in ('RGB', 'L'):
+            return image.convert('RGB')
+        return image
 
-        # Start new preload thread
-        self.preload_thread = threading.Thread(
-            target=self._preload_worker,
-            args=(current_index,),
-            daemon=True
-        )
-        self.preload_thread.start()
+    def preload_adjacent(self, current_index: int, mode: Optional[str] = None,
+                         window_size: Optional[Tuple[int, int]] = None):
+        """
+        Load neighbouring pages in the background.
 
-    def _preload_worker(self, current_index: int):
-        """Background worker for preloading next page."""
-        next_index = current_index + 1
+        Preloads the next preload_pages pages and the previous one, skipping
+        pages already cached or being loaded. Pages beyond what the scaled
+        cache can hold only have their compressed bytes fetched. Earlier
+        preloads are left to finish since they are likely to be needed
+        when paging back.
 
-        # Check if next page exists and is not cached
-        if next_index < self.index_data['total_pages'] and next_index not in self.cache:
-            if not self.preload_cancel.is_set():
-                try:
-                    image = self._load_page(next_index)
-                    if not self.preload_cancel.is_set():
-                        self._add_to_cache(next_index, image)
-                except Exception as e:
-                    # Silently fail on preload errors
-                    print(f"Preload failed for page {next_index}: {e}")
+        Args:
+            current_index: Page currently displayed
+            mode: Viewing mode to prescale pages for (None = only fetch bytes)
+            window_size: (width, height) of display area, needed with mode
+        """
+        # Let the kernel fetch upcoming pages' bytes from disk in the background
+        upcoming = self._page_paths[current_index + 1:current_index + 1 + self.readahead_pages]
+        self.session.prefetch(upcoming)
+
+        # Forward reading is most likely, so submit forward pages first.
+        # Never preload more pages than the caches can hold; the nearest
+        # ones are prescaled, the rest only fetched.
+        targets = [current_index + n for n in range(1, self.preload_pages + 1)]
+        targets.append(current_index - 1)
+        targets = targets[:max(self.max_cache_size - 1, 0)]
+        scaled_count = max(self.max_scaled_cache_size - 1, 0) if mode is not None else 0
+
+        submitted = []
+        with self.cache_lock:
+            for position, page_index in enumerate(targets):
+                if not 0 <= page_index < self.index_data['total_pages']:
+                    continue
+                if page_index in self._inflight:
+                    continue
+                page_mode = mode if position < scaled_count else None
+                if page_mode is None:
+                    if page_index in self.cache:
+                        continue
+                elif self._scaled_key(page_index, page_mode, window_size) in self.scaled_cache:
+                    continue
+
+                future = self._executor.submit(self._preload_one, page_index, page_mode, window_size)
+                self._inflight[page_index] = future
+                submitted.append((page_index, future))
+
+        # Outside the lock: a callback on an already finished future runs
+        # immediately and takes the lock itself
+        for page_index, future in submitted:
+            future.add_done_callback(
+                lambda _, page_index=page_index: self._preload_done(page_index))
+
+    def _preload_one(self, page_index: int, mode: Optional[str],
+                     window_size: Optional[Tuple[int, int]]):
+        """Load one page into the caches (runs on a preload worker)."""
+        try:
+            if mode is None:
+                self._get_page_data(page_index)
+            else:
+                self.get_scaled_page(page_index, mode, window_size)
+        except Exception as e:
+            # Silently fail on preload errors
+            print(f"Preload failed for page {page_index}: {e}")
+
+    def _preload_done(self, page_index: int):
+        """Forget a finished (or cancelled) preload."""
+        with self.cache_lock:
+            self._inflight.pop(page_index, None)
 
     def clear_cache(self):
-        """Clear all cached images."""
-        for image in self.cache.values():
-            image.close()
-        self.cache.clear()
-        self.access_order.clear()
+        """Clear all cached pages."""
+        with self.cache_lock:
+            self.cache.clear()
+            self.scaled_cache.clear()
@@ -1,13 +1,22 @@
 """Index management for comic archives - creates and validates JSON index files."""
 
+import functools
 import json
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 import xxhash
 from xdg_base_dirs import xdg_cache_home
 
-from . import archive_handler
+from . import archive_handler, json_io
+
+
+# Index schema version - bump to force a one-time rebuild of cached indexes
+INDEX_VERSION = '1.3'
+
+# Per-page fields, stored once; each page is a row of values in this order
+PAGE_COLUMNS = ['index', 'filename', 'archive_path', 'header_offset', 'size',
+                'compressed_size', 'format', 'width', 'height']
 
 
 def get_cache_dir() -> Path:
@@ -19,73 +28,119 @@ def get_cache_dir() -> Path:
 
 def get_index_path(archive_path: Path) -> Path:
     """Generate index file path using xxhash of archive path."""
-    archive_path = Path(archive_path).resolve()
-    path_hash = xxhash.xxh64(str(archive_path).encode()).hexdigest()[:16]
+    return _index_path_cached(str(archive_path))
+
+
+@functools.lru_cache(maxsize=128)
+def _index_path_cached(path_str: str) -> Path:
+    """Resolve and hash an archive path once per session (see get_index_path)."""
+    archive_path = Path(path_str).resolve()
+    path_hash = xxhash.xxh3_64(str(archive_path).encode()).hexdigest()[:16]
     filename = f"{path_hash}_{archive_path.name}.json"
     return get_cache_dir() / filename
 
 
-def compute_xxhash(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+def compute_xxhash(file_path: Path, chunk_size: int = 1024 * 1024,
+                   algorithm=xxhash.xxh3_64) -> str:
     """
-    Compute xxhash64 of first 1MB + last 1MB for fast validation.
+    Compute XXH3 (64-bit) of first 1MB + last 1MB for fast validation.
+
+    For files smaller than 2MB, hash the entire file. Results are memoized
+    per (path, mtime, size), so re-validating an unchanged archive within
+    one session costs a single stat.
 
-    For files smaller than 2MB, hash the entire file.
+    Args:
+        file_path: File to hash
+        chunk_size: Bytes hashed from each end of the file
+        algorithm: xxhash constructor (xxh64 reproduces pre-1.2 hashes)
+
+    Returns:
+        Hex digest string
     """
-    file_path = Path(file_path)
-    file_size = file_path.stat().st_size
-    hasher = xxhash.xxh64()
+    file_path = Path(file_path).resolve()
+    stat = file_path.stat()
+    return _xxhash_keyed(str(file_path), stat.st_mtime_ns, stat.st_size, chunk_size, algorithm)
+
+
+@functools.lru_cache(maxsize=32)
+def _xxhash_keyed(path_str: str, mtime_ns: int, size: int, chunk_size: int, algorithm) -> str:
+    """
+    Hash the head and tail of a file (see compute_xxhash).
+
+    mtime_ns and size are only part of the cache key: a modified file
+    produces a new key instead of a stale hit. Both chunks are read with
+    pread into one reusable buffer, skipping Python's buffered IO.
+    """
+    hasher = algorithm()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+
+    fd = os.open(path_str, os.O_RDONLY)
+    try:
+        file_size = os.fstat(fd).st_size
 
-    with open(file_path, 'rb') as f:
         # Read first chunk (up to 1MB)
-        first_chunk = f.read(chunk_size)
-        hasher.update(first_chunk)
+        count = os.preadv(fd, [buffer], 0)
+        hasher.update(view[:count])
 
         # If file is larger than 2MB, also read last chunk
         if file_size > 2 * chunk_size:
-            f.seek(-chunk_size, os.SEEK_END)
-            last_chunk = f.read(chunk_size)
-            hasher.update(last_chunk)
+            count = os.preadv(fd, [buffer], file_size - chunk_size)
+            hasher.update(view[:count])
+    finally:
+        os.close(fd)
 
     return hasher.hexdigest()
 
 
-def is_index_valid(index_data: Dict[str, Any], archive_path: Path) -> bool:
+def is_index_valid(index_data: Dict[str, Any], archive_path: Path, deep: bool = False) -> bool:
     """
     Validate index against current archive state.
 
     Three-tier validation:
-    1. Check mtime (primary, instant)
+    1. Check mtime in nanoseconds (primary, instant)
     2. Check size (secondary, instant)
-    3. Check xxhash (tertiary, fast but requires I/O)
+    3. Check xxhash (tertiary, requires I/O - only when deep=True)
+
+    Args:
+        index_data: Loaded index data
+        archive_path: Path to the archive file
+        deep: Also verify the xxhash of the archive contents
+
+    Returns:
+        True if the index matches the archive
     """
     archive_path = Path(archive_path)
 
-    # Check if archive file exists
-    if not archive_path.exists():
+    # Get current archive stats (also checks that the archive exists)
+    try:
+        stat = archive_path.stat()
+    except OSError:
         return False
-
-    # Get current archive stats
-    stat = archive_path.stat()
     current_size = stat.st_size
-    current_mtime = stat.st_mtime
+    current_mtime_ns = stat.st_mtime_ns
+
+    # Validate version compatibility
+    if index_data.get('version') != INDEX_VERSION:
+        return False
 
     # Validate mtime (primary check)
-    if index_data.get('archive_mtime') != current_mtime:
+    if index_data.get('archive_mtime_ns') != current_mtime_ns:
         return False
 
     # Validate size (secondary check)
     if index_data.get('archive_size') != current_size:
         return False
 
+    # mtime + size already catch modified or replaced archives
+    if not deep:
+        return True
+
     # Validate xxhash (tertiary check - most reliable but slower)
     current_hash = compute_xxhash(archive_path)
     if index_data.get('archive_xxhash') != current_hash:
         return False
 
-    # Validate version compatibility
-    if index_data.get('version') != '1.0':
-        return False
-
     return True
 
 
@@ -104,27 +159,26 @@ def create_index(archive_path: Path) -> Dict[str, Any]:
     stat = archive_path.stat()
 
     # Open archive and get page list
-    with archive_handler.open_archive(archive_path) as zip_file:
-        image_files = archive_handler.list_image_files(zip_file)
+    with archive_handler.ArchiveSession(archive_path) as session:
+        image_files = session.list_image_files()
         sorted_files = archive_handler.natural_sort_pages(image_files)
 
-        # Extract metadata for each page
-        pages = []
-        for idx, filename in enumerate(sorted_files):
-            page_info = archive_handler.get_page_info(zip_file, filename)
-            page_info['index'] = idx
-            pages.append(page_info)
+    # Extract metadata for each page (in parallel, order preserved)
+    pages = archive_handler.build_page_index(archive_path, sorted_files)
+    for idx, page_info in enumerate(pages):
+        page_info['index'] = idx
+    rows = [[page_info[column] for column in PAGE_COLUMNS] for page_info in pages]
 
     # Build index
     index_data = {
-        'version': '1.0',
+        'version': INDEX_VERSION,
         'archive_file': str(archive_path),
         'archive_size': stat.st_size,
-        'archive_mtime': stat.st_mtime,
+        'archive_mtime_ns': stat.st_mtime_ns,
         'archive_xxhash': compute_xxhash(archive_path),
         'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
         'total_pages': len(pages),
-        'pages': pages,
+        'pages': {'columns': PAGE_COLUMNS, 'rows': rows},
         'metadata': {
             'indexing_duration_ms': int((time.time() - start_time) * 1000),
             'viewer_version': '1.0.0'
@@ -134,11 +188,31 @@ def create_index(archive_path: Path) -> Dict[str, Any]:
     return index_data
 
 
-def load_or_create_index(archive_path: Path) -> Dict[str, Any]:
+def page_column(index_data: Dict[str, Any], column: str) -> List[Any]:
+    """
+    Get one per-page field for all pages, in page order.
+
+    Args:
+        index_data: Index data with page information
+        column: Field name from PAGE_COLUMNS (e.g. 'archive_path')
+
+    Returns:
+        List with the field's value for each page
+    """
+    pages = index_data['pages']
+    position = pages['columns'].index(column)
+    return [row[position] for row in pages['rows']]
+
+
+def load_or_create_index(archive_path: Path, verify: bool = False) -> Dict[str, Any]:
     """
     Load existing index or create new one if invalid/missing.
 
     This is the main entry point for index operations.
+
+    Args:
+        archive_path: Path to the archive file
+        verify: Also check a cached index against the archive's xxhash
     """
     archive_path = Path(archive_path).resolve()
     index_path = get_index_path(archive_path)
@@ -146,11 +220,10 @@ def load_or_create_index(archive_path: Path) -> Dict[str, Any]:
     # Try to load existing index
     if index_path.exists():
         try:
-            with open(index_path, 'r', encoding='utf-8') as f:
-                index_data = json.load(f)
+            index_data = json_io.read_json(index_path)
 
             # Validate index
-            if is_index_valid(index_data, archive_path):
+            if is_index_valid(index_data, archive_path, deep=verify):
                 print(f"Using cached index: {index_path.name}")
                 return index_data
             else:
@@ -164,8 +237,8 @@ def load_or_create_index(archive_path: Path) -> Dict[str, Any]:
 
     # Save index to cache
     try:
-        with open(index_path, 'w', encoding='utf-8') as f:
-            json.dump(index_data, f, indent=2)
+        # Machine-read only: write compactly
+        json_io.write_json(index_path, index_data, indent=False)
         print(f"Index created: {index_path.name} ({index_data['metadata']['indexing_duration_ms']}ms)")
     except OSError as e:
         print(f"Warning: Could not save index to cache: {e}")
@@ -1,25 +1,43 @@
 """State management for comic viewer - tracks last read page per archive."""
 
+import functools
 import json
 from pathlib import Path
 from typing import Optional
 import xxhash
 
+from . import json_io
 from .index_manager import get_cache_dir, compute_xxhash
 
 
+# State schema version - 1.0 files (xxh64 keys and hashes) are still read
+STATE_VERSION = '1.1'
+
+
 def get_state_path(archive_path: Path) -> Path:
     """
     Generate state file path using xxhash of archive path.
 
     Similar to index files, but uses _state.json suffix.
     """
-    archive_path = Path(archive_path).resolve()
-    path_hash = xxhash.xxh64(str(archive_path).encode()).hexdigest()[:16]
+    return _state_path_cached(str(archive_path))
+
+
+@functools.lru_cache(maxsize=128)
+def _state_path_cached(path_str: str) -> Path:
+    """Resolve and hash an archive path once per session (see get_state_path)."""
+    archive_path = Path(path_str).resolve()
+    path_hash = xxhash.xxh3_64(str(archive_path).encode()).hexdigest()[:16]
     filename = f"{path_hash}_state.json"
     return get_cache_dir() / filename
 
 
+def _get_legacy_state_path(archive_path: Path) -> Path:
+    """Return the version 1.0 state file path (keyed by xxh64)."""
+    path_hash = xxhash.xxh64(str(archive_path).encode()).hexdigest()[:16]
+    return get_cache_dir() / f"{path_hash}_state.json"
+
+
 def is_state_valid(state_data: dict, archive_path: Path) -> bool:
     """
     Validate state file against current archive.
@@ -27,25 +45,36 @@ def is_state_valid(state_data: dict, archive_path: Path) -> bool:
     Checks:
     1. Version compatibility
     2. Archive file path matches
-    3. Archive xxhash matches (detects file modifications)
+    3. Archive mtime and size match the recorded stat (instant)
+    4. Otherwise, archive xxhash matches (detects file modifications)
     """
     archive_path = Path(archive_path).resolve()
 
-    # Check if archive file exists
-    if not archive_path.exists():
+    # Get current archive stats (also checks that the archive exists)
+    try:
+        stat = archive_path.stat()
+    except OSError:
         return False
 
     # Validate version
-    if state_data.get('version') != '1.0':
+    version = state_data.get('version')
+    if version not in (STATE_VERSION, '1.0'):
         return False
 
     # Validate archive path
     if state_data.get('archive_file') != str(archive_path):
         return False
 
-    # Validate xxhash (detects if archive was modified/replaced)
+    # Unchanged stat since the state was saved - no need to hash
+    if (state_data.get('archive_mtime_ns') == stat.st_mtime_ns
+            and state_data.get('archive_size') == stat.st_size):
+        return True
+
+    # Validate xxhash (detects if archive was modified/replaced; also covers
+    # a touched or re-copied archive, and state files without a recorded stat)
+    algorithm = xxhash.xxh64 if version == '1.0' else xxhash.xxh3_64
     try:
-        current_hash = compute_xxhash(archive_path)
+        current_hash = compute_xxhash(archive_path, algorithm=algorithm)
         if state_data.get('archive_xxhash') != current_hash:
             return False
     except Exception:
@@ -66,14 +95,15 @@ def load_state(archive_path: Path) -> Optional[int]:
     archive_path = Path(archive_path).resolve()
     state_path = get_state_path(archive_path)
 
-    # Check if state file exists
+    # Check if state file exists (falling back to a version 1.0 file)
     if not state_path.exists():
-        return None
+        state_path = _get_legacy_state_path(archive_path)
+        if not state_path.exists():
+            return None
 
     # Try to load state file
     try:
-        with open(state_path, 'r', encoding='utf-8') as f:
-            state_data = json.load(f)
+        state_data = json_io.read_json(state_path)
     except json.JSONDecodeError as e:
         print(f"Warning: Corrupted state file, starting at page 0: {e}")
         return None
@@ -95,13 +125,15 @@ def load_state(archive_path: Path) -> Optional[int]:
     return last_page
 
 
-def save_state(archive_path: Path, page_index: int) -> None:
+def save_state(archive_path: Path, page_index: int,
+               archive_xxhash: Optional[str] = None) -> None:
     """
     Save current page for archive.
 
     Args:
         archive_path: Path to the archive file
         page_index: Current page index (0-based)
+        archive_xxhash: Archive hash from the index; computed if not given
 
     Silent error handling - failures are logged but don't raise exceptions.
     """
@@ -112,10 +144,15 @@ def save_state(archive_path: Path, page_index: int) -> None:
 
     # Build state data
     try:
+        stat = archive_path.stat()
+        if archive_xxhash is None:
+            archive_xxhash = compute_xxhash(archive_path)
         state_data = {
-            'version': '1.0',
+            'version': STATE_VERSION,
             'archive_file': str(archive_path),
-            'archive_xxhash': compute_xxhash(archive_path),
+            'archive_size': stat.st_size,
+            'archive_mtime_ns': stat.st_mtime_ns,
+            'archive_xxhash': archive_xxhash,
             'last_page': page_index,
             'updated_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
         }
@@ -123,9 +160,8 @@ def save_state(archive_path: Path, page_index: int) -> None:
         print(f"Warning: Could not compute state data: {e}")
         return
 
-    # Write state file
+    # Write state file (compact, atomically replaced)
     try:
-        with open(state_path, 'w', encoding='utf-8') as f:
-            json.dump(state_data, f, indent=2)
+        json_io.write_json(state_path, state_data, indent=False)
     except OSError as e:
         print(f"Warning: Could not save state: {e}")
@@ -1,9 +1,13 @@
 """Tkinter-based viewer window for comic archives."""
 
+import os
+import threading
 import tkinter as tk
+from collections import OrderedDict
 from tkinter import messagebox
 from pathlib import Path
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
 from PIL import Image, ImageTk
 
 from .image_cache import ImageCache
@@ -11,6 +15,46 @@ from . import state_manager, config_manager
 from .file_browser import FileBrowser
 
 
+# Delay after the last resize event before rescaling the page
+RESIZE_DEBOUNCE_MS = 120
+
+# Delay after the last Ctrl+wheel zoom notch before the full-quality render
+ZOOM_FINALIZE_MS = 200
+
+# Number of rendered pages (PhotoImages) kept for instant redisplay
+PHOTO_CACHE_SIZE = 8
+
+# How often to check whether a background render has finished
+RENDER_POLL_MS = 10
+
+# Pages are rendered for the canvas size rounded down to this many pixels,
+# so small window size changes still hit the render caches
+RENDER_SIZE_STEP = 16
+
+# Extra area rendered around the view when zoomed, as a fraction of the
+# canvas size on each side, so short scrolls don't need a re-render
+VIEWPORT_MARGIN = 0.5
+
+# Delay after scrolling past the rendered area before rendering the new view
+VIEWPORT_RENDER_DELAY_MS = 50
+
+# Hand pages to Tk as raw PPM data instead of through ImageTk (opt-in:
+# COMIC_VIEWER_PPM_PHOTOS=1). Which is faster depends on the Tk build.
+PPM_PHOTOS = os.environ.get('COMIC_VIEWER_PPM_PHOTOS') == '1'
+
+# Delay after the last page change before the reading position is saved
+STATE_SAVE_DELAY_MS = 500
+
+# X11 wheel buttons: Button-4 turns the wheel up/away, Button-5 down/towards
+WHEEL_BUTTON_DIRECTIONS = {4: 1, 5: -1}
+
+# Shortcut hints shown at the end of the status bar: (not zoomed, zoomed)
+STATUS_SHORTCUTS = (
+    "[←→ navigate, g goto, f/h/a modes, z zoom, ? help, q quit]",
+    "[←→ pages, g goto, wasd pan, +/- zoom, z exit, ? help, q quit]",
+)
+
+
 class ViewerWindow:
     """
     Main viewer window with image display and navigation.
@@ -29,6 +73,8 @@ class ViewerWindow:
             initial_page: Initial page to display (default 0)
         """
         self.archive_path = archive_path
+        # Page count never changes for an open archive
+        self._total_pages = index_data['total_pages']
         self.index_data = index_data
         self.image_cache = image_cache
 
@@ -44,9 +90,54 @@ class ViewerWindow:
         # File switching state
         self.switch_to_file = None
 
+        # Pending debounced resize refresh (Tk after id)
+        self._resize_after_id = None
+
+        # Ctrl+wheel zoom renders with a cheap filter until the wheel stops
+        self._zoom_is_interactive = False
+        self._zoom_finalize_after_id = None
+
+        # Wheel notches only update zoom_level; one render per idle picks them up
+        self._zoom_render_scheduled = False
+
+        # Page turns queued by next/previous (key repeat) until the next idle
+        self._pending_page = None
+
+        # Pages are scaled on worker threads; the latest request is
+        # (photo_key, future, cacheable, canvas_size, view) until the main
+        # thread installs it
+        self._render_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='render')
+        self._pending_render = None
+        self._render_poll_id = None
+
+        # Scroll position (x, y fractions) for the next scrollable page shown
+        self._next_view_position = (0.0, 0.0)
+
+        # Neighbouring pages being rendered ahead: {photo_key: future}
+        self._prebuilds = {}
+        self._prebuild_poll_id = None
+
+        # Last page decoded for zooming: (page_index, {reduction factor: PIL Image}),
+        # holding the full-resolution page (factor 1) and reductions made from it.
+        # Only the page on screen is kept; render workers swap it under the lock
+        self._native_image = None
+        self._native_lock = threading.Lock()
+
+        # Canvas area covered by the zoomed render, (x0, y0, x1, y1, page_width,
+        # page_height), or None when the page isn't scrollable
+        self._rendered_region = None
+        self._viewport_after_id = None
+        # Scroll position (x, y fractions) as last reported by the canvas
+        self._view_fractions = [0.0, 0.0]
+
+        # Pending reading-position save (written once page turns settle)
+        self._state_after_id = None
+
         # Create window
         self.root = tk.Tk()
         self.root.title(f"Comic Viewer - {archive_path.name}")
+        # Closing the window goes through quit() so the final state is saved
+        self.root.protocol("WM_DELETE_WINDOW", self.quit)
 
         # Configure cursor to use system theme
         try:
@@ -74,11 +165,20 @@ class ViewerWindow:
         # Bind keyboard shortcuts
         self._bind_shortcuts()
 
+        # Lay out the window now so the first page is scaled for the real
+        # canvas size rather than the defaults (and not scaled twice)
+        self.root.update_idletasks()
+
+        # Canvas (width, height), kept current from <Configure> events so the
+        # render and scroll paths don't query Tk for it
+        self._canvas_dims = (self.canvas.winfo_width(), self.canvas.winfo_height())
+
         # Show initial page
         self.show_page(initial_page)
 
         # Track window size for resize events
-        self.last_window_size = (self.canvas.winfo_width(), self.canvas.winfo_height())
+        self.last_window_size = self._canvas_dims
+        self._root_size = (self.root.winfo_width(), self.root.winfo_height())
         self.root.bind('<Configure>', self._on_window_resize)
 
     def _create_ui(self):
@@ -100,10 +200,18 @@ class ViewerWindow:
         self.h_scrollbar = tk.Scrollbar(self.main_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
 
         # Configure canvas to use scrollbars
-        self.canvas.configure(yscrollcommand=self.v_scrollbar.set, xscrollcommand=self.h_scrollbar.set)
+        self.canvas.configure(yscrollcommand=self._on_canvas_yscroll,
+                              xscrollcommand=self._on_canvas_xscroll)
 
         # Pack canvas (scrollbars will be packed/unpacked dynamically)
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        self._vscroll_shown = False
+        self._hscroll_shown = False
+
+        # Single canvas item showing the page; its image and position are
+        # updated in place rather than recreated for every page
+        self.page_item = self.canvas.create_image(0, 0, anchor=tk.NW, tags='page')
+        self._page_anchor = tk.NW
 
         # Status bar
         self.status_bar = tk.Label(
@@ -117,51 +225,74 @@ class ViewerWindow:
             font=('Arial', 10)
         )
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        self._last_status = ''
 
         # Store reference to current PhotoImage (prevent garbage collection)
         self.current_photo = None
+        # (photo_key, placement) of the render on screen, for relayout on resize
+        self._displayed = None
+        # Reused for renders that aren't cached (see _new_photo)
+        self._scratch_photo = None
+
+        # LRU of rendered pages:
+        # {(page, zoom_mode, zoom_level or viewing_mode, canvas_w, canvas_h, view):
+        #  (PhotoImage, placement)}
+        self._photo_cache: 'OrderedDict[tuple, tuple]' = OrderedDict()
 
     def _bind_shortcuts(self):
         """Bind keyboard shortcuts."""
-        # Navigation
-        self.root.bind('<Right>', lambda e: self.next_page())
-        self.root.bind('<space>', lambda e: self.next_page())
-        self.root.bind('<Next>', lambda e: self.next_page())  # Page Down
-
-        self.root.bind('<Left>', lambda e: self.previous_page())
-        self.root.bind('<BackSpace>', lambda e: self.previous_page())
-        self.root.bind('<Prior>', lambda e: self.previous_page())  # Page Up
-
-        self.root.bind('<Home>', lambda e: self.first_page())
-        self.root.bind('<End>', lambda e: self.last_page())
-        self.root.bind('g', lambda e: self.goto_page_dialog())
-
-        # Viewing modes
-        self.root.bind('f', lambda e: self.set_viewing_mode('fit-width'))
-        self.root.bind('h', lambda e: self.set_viewing_mode('fit-height'))
-
-        # Zoom controls
-        self.root.bind('z', lambda e: self.toggle_zoom_mode())
-        self.root.bind('<plus>', lambda e: self.zoom_in())
-        self.root.bind('<equal>', lambda e: self.zoom_in())  # = key (+ without shift)
-        self.root.bind('<KP_Add>', lambda e: self.zoom_in())  # Numpad +
-        self.root.bind('<minus>', lambda e: self.zoom_out())
-        self.root.bind('<underscore>', lambda e: self.zoom_out())  # _ (- with shift)
-        self.root.bind('<KP_Subtract>', lambda e: self.zoom_out())  # Numpad -
-        self.root.bind('0', lambda e: self.reset_zoom())
+        # Keyboard shortcuts: {event sequence: handler}
+        self._keymap = {
+            # Navigation
+            '<Right>': self.next_page,
+            '<space>': self.next_page,
+            '<Next>': self.next_page,  # Page Down
+            '<Left>': self.previous_page,
+            '<BackSpace>': self.previous_page,
+            '<Prior>': self.previous_page,  # Page Up
+            '<Home>': self.first_page,
+            '<End>': self.last_page,
+            'g': self.goto_page_dialog,
+
+            # Viewing modes
+            'f': lambda: self.set_viewing_mode('fit-width'),
+            'h': lambda: self.set_viewing_mode('fit-height'),
+
+            # Zoom controls
+            'z': self.toggle_zoom_mode,
+            '<plus>': self.zoom_in,
+            '<equal>': self.zoom_in,  # = key (+ without shift)
+            '<KP_Add>': self.zoom_in,  # Numpad +
+            '<minus>': self.zoom_out,
+            '<underscore>': self.zoom_out,  # _ (- with shift)
+            '<KP_Subtract>': self.zoom_out,  # Numpad -
+            '0': self.reset_zoom,
+
+            # Pan controls (WASD) and mode switching
+            # These handle both pan (in zoom mode) and mode switching (not in zoom mode)
+            'w': self.pan_up,
+            's': self.pan_down,
+            'a': self._handle_a_key,
+            'd': self.pan_right,
+
+            # Help
+            '?': self.show_help,
+
+            # Open file browser
+            'o': self.open_file_browser,
+
+            # Quit
+            'q': self.quit,
+            '<Escape>': self.quit,
+        }
+        for sequence, handler in self._keymap.items():
+            self.root.bind(sequence, lambda e, handler=handler: handler())
 
         # Mouse wheel zoom (Ctrl+Wheel)
         self.canvas.bind('<Control-MouseWheel>', self._on_ctrl_wheel)
         self.canvas.bind('<Control-Button-4>', self._on_ctrl_wheel)  # Linux scroll up
         self.canvas.bind('<Control-Button-5>', self._on_ctrl_wheel)  # Linux scroll down
 
-        # Pan controls (WASD) and mode switching
-        # These handle both pan (in zoom mode) and mode switching (not in zoom mode)
-        self.root.bind('w', lambda e: self.pan_up())
-        self.root.bind('s', lambda e: self.pan_down())
-        self.root.bind('a', lambda e: self._handle_a_key())
-        self.root.bind('d', lambda e: self.pan_right())
-
         # Mouse wheel scrolling (when zoomed)
         self.root.bind('<Button-4>', self._on_mouse_wheel)  # Linux scroll up
         self.root.bind('<Button-5>', self._on_mouse_wheel)  # Linux scroll down
@@ -173,123 +304,466 @@ class ViewerWindow:
         self.canvas.bind('<Shift-Button-4>', self._on_shift_wheel)  # Also bind to canvas
         self.canvas.bind('<Shift-Button-5>', self._on_shift_wheel)
 
-        # Help
-        self.root.bind('?', lambda e: self.show_help())
-
-        # Open file browser
-        self.root.bind('o', lambda e: self.open_file_browser())
-
-        # Quit
-        self.root.bind('q', lambda e: self.quit())
-        self.root.bind('<Escape>', lambda e: self.quit())
-
     def show_page(self, page_index: int):
         """
         Display a specific page.
 
+        Pages not rendered before are scaled on a worker thread so the UI
+        stays responsive; the result is put on the canvas once ready.
+
         Args:
             page_index: Zero-based page index
         """
-        if page_index < 0 or page_index >= self.index_data['total_pages']:
+        if page_index < 0 or page_index >= self._total_pages:
             return
 
+        self._pending_page = None
         self.current_page = page_index
 
-        # Save state (opportunistic, silent failures)
+        # Save state once page turns settle, keeping disk writes off the page turn
+        self._cancel_state_save()
+        self._state_after_id = self.root.after(STATE_SAVE_DELAY_MS, self._flush_state)
+
+        render_size = self._render_current()
+
+        # Update status bar
+        self._update_status()
+
+        # Preload adjacent pages (prescaled unless zoomed)
+        try:
+            if self.zoom_mode:
+                self.image_cache.preload_adjacent(page_index)
+            else:
+                self.image_cache.preload_adjacent(page_index, self.viewing_mode, render_size)
+        except Exception as e:
+            print(f"Warning: Could not preload pages: {e}")
+
+        # Render the neighbours while idle so turning to them is instant
+        self.root.after_idle(self._prebuild_neighbor, page_index + 1)
+        self.root.after_idle(self._prebuild_neighbor, page_index - 1)
+
+    def _flush_state(self):
+        """Save the reading position (opportunistic, silent failures)."""
+        self._state_after_id = None
         try:
-            state_manager.save_state(self.archive_path, self.current_page)
+            state_manager.save_state(self.archive_path, self.current_page,
+                                     self.index_data.get('archive_xxhash'))
         except Exception:
             pass  # Don't disrupt viewing
 
-        try:
-            # Get image from cache
-            image = self.image_cache.get_page(page_index)
+    def _cancel_state_save(self):
+        """Drop a pending state save (before saving synchronously instead)."""
+        if self._state_after_id is not None:
+            self.root.after_cancel(self._state_after_id)
+            self._state_after_id = None
 
-            # Get canvas size
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
+    def _render_current(self, view: Optional[Tuple[float, float]] = None,
+                        reposition: bool = True) -> Tuple[int, int]:
+        """
+        Render the current page with the current mode, zoom and canvas size.
 
-            # Use reasonable defaults if canvas not yet sized
-            if canvas_width <= 1:
-                canvas_width = 1200
-            if canvas_height <= 1:
-                canvas_height = 900
+        Used directly for zoom changes, which don't need show_page's state
+        saving and preloading.
 
-            # Scale image based on mode
-            if self.zoom_mode:
-                # Apply zoom scaling
-                scaled_image = self._apply_zoom(image, self.zoom_level)
-            else:
-                # Use existing viewing mode logic
-                scaled_image = self.image_cache.scale_image(
-                    image,
-                    self.viewing_mode,
-                    (canvas_width, canvas_height)
-                )
+        Args:
+            view: Scroll position (x, y fractions) to render around when
+                zoomed; defaults to the position for a newly shown page
+            reposition: Scroll to view once displayed (False when re-rendering
+                the area the user has scrolled to)
 
-            # Convert to PhotoImage
-            self.current_photo = ImageTk.PhotoImage(scaled_image)
-
-            # Clear canvas and display image
-            self.canvas.delete('all')
-
-            # Determine if scrolling is needed (size-based, works in any mode)
-            img_width, img_height = scaled_image.size
-            needs_scroll = (img_width > canvas_width or img_height > canvas_height)
-
-            if needs_scroll:
-                # Scrollable layout - use NW anchor for scrollable positioning
-                self.canvas.create_image(0, 0, image=self.current_photo, anchor=tk.NW)
-                self.canvas.configure(scrollregion=(0, 0, img_width, img_height))
-                self._update_scrollbars(img_width, img_height)
-                # Reset scroll position to top-left
-                self.canvas.xview_moveto(0)
-                self.canvas.yview_moveto(0)
+        Returns:
+            (width, height) the page was rendered for (see _render_size)
+        """
+        page_index = self.current_page
+        canvas_size = self._canvas_size()
+        render_size = self._render_size(canvas_size)
+        if view is None:
+            view = self._next_view_position
+
+        # Drop a render for a page/view that is no longer wanted
+        if self._pending_render is not None:
+            self._pending_render[1].cancel()
+            self._pending_render = None
+
+        # Reuse the rendered page if it was shown the same way before
+        photo_key = self._photo_key(page_index, render_size, view)
+        cached = self._photo_cache.get(photo_key)
+        if cached is not None:
+            self._photo_cache.move_to_end(photo_key)
+            photo, placement = cached
+            self._displayed = (photo_key, placement)
+            self._display_photo(photo, placement, canvas_size, view if reposition else None)
+        else:
+            # Adopt a matching idle prebuild, so the page isn't rendered twice
+            future = self._prebuilds.pop(photo_key, None)
+            if future is not None and self._zoom_is_interactive:
+                # A quick preview is wanted instead; don't render the page twice
+                future.cancel()
+                future = None
+            if future is None:
+                future = self._render_executor.submit(
+                    self._produce_scaled_image, page_index, self.zoom_mode, self.zoom_level,
+                    self.viewing_mode, render_size, self._zoom_is_interactive, view)
+            # Quick zoom previews and scrolled-to areas aren't worth caching
+            cacheable = not self._zoom_is_interactive and reposition
+            self._pending_render = (photo_key, future, cacheable, canvas_size,
+                                    view if reposition else None)
+            # One poll loop serves whichever render is pending
+            if self._render_poll_id is None:
+                self._render_poll_id = self.root.after(RENDER_POLL_MS, self._poll_render)
+
+        # Prebuilds that haven't started yet would delay this page's render
+        for key, future in list(self._prebuilds.items()):
+            if future.cancel():
+                del self._prebuilds[key]
+
+        return render_size
+
+    def _canvas_size(self) -> Tuple[int, int]:
+        """Return the canvas (width, height), with defaults before it's sized."""
+        canvas_width, canvas_height = self._canvas_dims
+
+        # Use reasonable defaults if canvas not yet sized
+        if canvas_width <= 1:
+            canvas_width = 1200
+        if canvas_height <= 1:
+            canvas_height = 900
+        return canvas_width, canvas_height
+
+    @staticmethod
+    def _render_size(canvas_size: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Round a canvas size down to the RENDER_SIZE_STEP grid.
+
+        The page is centered on the canvas, so rendering up to a step smaller
+        only widens the border slightly.
+        """
+        canvas_width, canvas_height = canvas_size
+        return (max(RENDER_SIZE_STEP, canvas_width // RENDER_SIZE_STEP * RENDER_SIZE_STEP),
+                max(RENDER_SIZE_STEP, canvas_height // RENDER_SIZE_STEP * RENDER_SIZE_STEP))
+
+    def _photo_key(self, page_index: int, canvas_size: Tuple[int, int],
+                   view: Tuple[float, float]) -> tuple:
+        """Build the photo cache key for a page shown with the current view settings."""
+        return (page_index, self.zoom_mode,
+                self.zoom_level if self.zoom_mode else self.viewing_mode,
+                canvas_size[0], canvas_size[1],
+                view if self._renders_viewport() else None)
+
+    def _renders_viewport(self) -> bool:
+        """Whether only the area around the view is rendered (zoom and actual size)."""
+        return self.zoom_mode or self.viewing_mode == 'actual'
+
+    def _prebuild_neighbor(self, page_index: int):
+        """
+        Render a neighbouring page into the photo cache in the background.
+
+        Scheduled with after_idle once a page is shown, so that turning
+        to the page next is just a cache hit.
+        """
+        if not 0 <= page_index < self._total_pages:
+            return
+        if self._zoom_is_interactive:
+            return
+
+        # A newly shown page starts at the top-left
+        canvas_size = self._render_size(self._canvas_size())
+        view = (0.0, 0.0)
+        photo_key = self._photo_key(page_index, canvas_size, view)
+        if photo_key in self._photo_cache or photo_key in self._prebuilds:
+            return
+
+        self._prebuilds[photo_key] = self._render_executor.submit(
+            self._produce_scaled_image, page_index, self.zoom_mode, self.zoom_level,
+            self.viewing_mode, canvas_size, False, view)
+        if self._prebuild_poll_id is None:
+            self._prebuild_poll_id = self.root.after(RENDER_POLL_MS, self._poll_prebuilds)
+
+    def _poll_prebuilds(self):
+        """Add finished prebuilds to the photo cache."""
+        self._prebuild_poll_id = None
+
+        for photo_key, future in list(self._prebuilds.items()):
+            if not future.done():
+                continue
+            del self._prebuilds[photo_key]
+            if future.cancelled() or future.exception() is not None:
+                continue
+            if photo_key not in self._photo_cache:
+                scaled_image, placement = future.result()
+                photo = self._new_photo(scaled_image, cache=True)
+                self._photo_cache[photo_key] = (photo, placement)
+
+        if self._prebuilds:
+            self._prebuild_poll_id = self.root.after(RENDER_POLL_MS, self._poll_prebuilds)
+
+    def _produce_scaled_image(self, page_index: int, zoom_mode: bool, zoom_level: float,
+                              viewing_mode: str, canvas_size: Tuple[int, int],
+                              interactive: bool, view: Tuple[float, float]):
+        """
+        Load and scale a page for display (runs on a render worker).
+
+        Only does PIL work - Tk must not be touched off the main thread.
+
+        Returns:
+            (scaled PIL Image, placement) - see _apply_zoom
+        """
+        if zoom_mode:
+            # Apply zoom scaling to the full-resolution page, decoding it
+            # only once while the zoom level changes
+            with self._native_lock:
+                native = self._native_image
+            if native is not None and native[0] == page_index:
+                ladder = native[1]
             else:
-                # Centered layout - image fits entirely in canvas
-                self.canvas.create_image(
-                    canvas_width // 2,
-                    canvas_height // 2,
-                    image=self.current_photo,
-                    anchor=tk.CENTER
-                )
-                self.canvas.configure(scrollregion=(0, 0, 0, 0))
-                self._hide_scrollbars()
-
-            # Update status bar
-            self._update_status()
+                ladder = {1: self.image_cache.get_page(page_index)}
+                # Neighbour prebuilds must not evict the page being zoomed
+                with self._native_lock:
+                    if page_index == self.current_page:
+                        self._native_image = (page_index, ladder)
+            return self._apply_zoom(ladder, zoom_level, canvas_size, interactive, view)
+
+        # Use existing viewing mode logic (cached per window size)
+        scaled_image = self.image_cache.get_scaled_page(page_index, viewing_mode, canvas_size)
+        page_size = scaled_image.size
+        if viewing_mode != 'actual':
+            return scaled_image, (0, 0) + page_size
+
+        # Actual size: hand Tk only the area around the view, not the whole scan
+        box = self._viewport_box(page_size, canvas_size, view)
+        if box != (0, 0) + page_size:
+            scaled_image = scaled_image.crop(box)
+        return scaled_image, box[:2] + page_size
+
+    def _poll_render(self):
+        """Install the pending render once its worker has finished."""
+        self._render_poll_id = None
+        if self._pending_render is None:
+            return
 
-            # Preload next page
-            self.image_cache.preload_adjacent(page_index)
+        photo_key, future, cacheable, canvas_size, view = self._pending_render
+        if not future.done():
+            self._render_poll_id = self.root.after(RENDER_POLL_MS, self._poll_render)
+            return
+        self._pending_render = None
 
+        page_index = photo_key[0]
+        try:
+            scaled_image, placement = future.result()
+
+            # Convert to PhotoImage
+            photo = self._new_photo(scaled_image, cache=cacheable)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to display page {page_index + 1}: {e}")
+            return
+
+        if cacheable:
+            self._photo_cache[photo_key] = (photo, placement)
+
+        self._displayed = (photo_key, placement)
+        self._display_photo(photo, placement, canvas_size, view)
+
+    def _new_photo(self, image: Image.Image, cache: bool) -> ImageTk.PhotoImage:
+        """
+        Convert a scaled page to a PhotoImage, recycling an evicted one.
+
+        When the photo cache is full, its oldest entry is evicted to make
+        room. If that PhotoImage has the same size (pages of one archive
+        usually do) the new page is pasted into it, reusing its Tk image
+        memory instead of allocating a new one. Renders that aren't cached
+        (zoom previews, scrolled-to areas) likewise reuse one scratch
+        PhotoImage, updating it in place even while it is on screen. With
+        PPM_PHOTOS set, new photos are plain tk.PhotoImages built from PPM
+        data instead.
+
+        Args:
+            image: Scaled PIL Image
+            cache: Whether the result will be added to the photo cache
+
+        Returns:
+            PhotoImage showing the image
+        """
+        if cache and len(self._photo_cache) >= PHOTO_CACHE_SIZE:
+            _, (oldest, _) = self._photo_cache.popitem(last=False)
+            if (isinstance(oldest, ImageTk.PhotoImage)
+                    and oldest is not self.current_photo
+                    and (oldest.width(), oldest.height()) == image.size):
+                oldest.paste(image)
+                return oldest
+
+        scratch = self._scratch_photo
+        if (not cache and isinstance(scratch, ImageTk.PhotoImage)
+                and (scratch.width(), scratch.height()) == image.size):
+            scratch.paste(image)
+            return scratch
+
+        if PPM_PHOTOS:
+            photo = self._ppm_photo(image)
+        else:
+            photo = ImageTk.PhotoImage(image)
+        if not cache:
+            self._scratch_photo = photo
+        return photo
+
+    @staticmethod
+    def _ppm_photo(image: Image.Image) -> tk.PhotoImage:
+        """
+        Create a Tk PhotoImage from a display-mode image's raw pixels.
+
+        Tk parses the binary PPM/PGM in one go, skipping ImageTk's
+        per-block transfer.
+
+        Args:
+            image: Scaled PIL Image in RGB or L mode (see ImageCache.to_display_mode)
+
+        Returns:
+            tk.PhotoImage showing the image
+        """
+        magic = b'P6' if image.mode == 'RGB' else b'P5'
+        header = b'%s\n%d %d\n255\n' % ((magic,) + image.size)
+        return tk.PhotoImage(data=header + image.tobytes(), format='PPM')
+
+    def _display_photo(self, photo: ImageTk.PhotoImage, placement: Tuple[int, int, int, int],
+                       canvas_size: Tuple[int, int], view: Optional[Tuple[float, float]]):
+        """
+        Put a rendered page on the canvas.
+
+        Args:
+            photo: Rendered page (or, when zoomed, the part of it around the view)
+            placement: (x, y, page_width, page_height) - where photo sits
+                within the full rendered page, and that page's size
+            canvas_size: (width, height) of the canvas it was rendered for
+            view: Scroll position (x, y fractions) to move to, or None to
+                keep the current one
+        """
+        canvas_width, canvas_height = canvas_size
+        x, y, page_width, page_height = placement
+        # A photo updated in place is already on the canvas item
+        photo_changed = photo is not self.current_photo
+        self.current_photo = photo
+
+        # Determine if scrolling is needed (size-based, works in any mode)
+        needs_scroll = (page_width > canvas_width or page_height > canvas_height)
+
+        if needs_scroll:
+            # Scrollable layout - the scroll region covers the whole page even
+            # when only the area around the view was rendered
+            self._rendered_region = (x, y, x + photo.width(), y + photo.height(),
+                                     page_width, page_height)
+            anchor = tk.NW
+            self.canvas.coords(self.page_item, x, y)
+            self.canvas.configure(scrollregion=(0, 0, page_width, page_height))
+            self._update_scrollbars(page_width, page_height, canvas_size)
+            if view is not None:
+                self.canvas.xview_moveto(view[0])
+                self.canvas.yview_moveto(view[1])
+                self._view_fractions[:] = view
+        else:
+            # Centered layout - image fits entirely in canvas
+            self._rendered_region = None
+            anchor = tk.CENTER
+            self.canvas.coords(self.page_item, canvas_width // 2, canvas_height // 2)
+            self.canvas.configure(scrollregion=(0, 0, 0, 0))
+            self._hide_scrollbars()
+
+        # Show the image on the persistent canvas item, only changing the
+        # anchor when the layout switches
+        if anchor != self._page_anchor:
+            self._page_anchor = anchor
+            self.canvas.itemconfigure(self.page_item, image=self.current_photo, anchor=anchor)
+        elif photo_changed:
+            self.canvas.itemconfigure(self.page_item, image=self.current_photo)
+        self._next_view_position = (0.0, 0.0)
+
+        # The user may have scrolled on while this area was rendering
+        self._check_viewport()
+
+    def _on_canvas_xscroll(self, first, last):
+        """Update the horizontal scrollbar and follow the view when zoomed."""
+        self.h_scrollbar.set(first, last)
+        self._view_fractions[0] = float(first)
+        self._check_viewport()
+
+    def _on_canvas_yscroll(self, first, last):
+        """Update the vertical scrollbar and follow the view when zoomed."""
+        self.v_scrollbar.set(first, last)
+        self._view_fractions[1] = float(first)
+        self._check_viewport()
+
+    def _check_viewport(self):
+        """Schedule a re-render if the view has left the rendered area."""
+        if self._rendered_region is None or self._viewport_after_id is not None:
+            return
+
+        # Runs on every scroll step - work from the fractions the canvas
+        # reported rather than asking Tk for the view
+        x0, y0, x1, y1, page_width, page_height = self._rendered_region
+        x_fraction, y_fraction = self._view_fractions
+        left = x_fraction * page_width
+        top = y_fraction * page_height
+        canvas_width, canvas_height = self._canvas_dims
+        right = min(left + canvas_width, page_width)
+        bottom = min(top + canvas_height, page_height)
+        if left < x0 or top < y0 or right > x1 or bottom > y1:
+            self._viewport_after_id = self.root.after(VIEWPORT_RENDER_DELAY_MS,
+                                                      self._refresh_viewport)
+
+    def _refresh_viewport(self):
+        """Render the area around the current scroll position."""
+        self._viewport_after_id = None
+        if self._renders_viewport():
+            self._render_current(view=tuple(self._view_fractions), reposition=False)
 
     def _update_status(self):
         """Update status bar text."""
         page_num = self.current_page + 1
-        total_pages = self.index_data['total_pages']
 
         if self.zoom_mode:
             zoom_pct = int(self.zoom_level * 100)
             mode_text = f"Zoom {zoom_pct}%"
-            shortcuts = "[←→ pages, g goto, wasd pan, +/- zoom, z exit, ? help, q quit]"
         else:
             mode_text = self.viewing_mode.replace('-', ' ').title()
-            shortcuts = "[←→ navigate, g goto, f/h/a modes, z zoom, ? help, q quit]"
+        shortcuts = STATUS_SHORTCUTS[self.zoom_mode]
 
-        status = f"Page {page_num} of {total_pages}  |  Mode: {mode_text}  |  {shortcuts}"
-        self.status_bar.config(text=status)
+        status = f"Page {page_num} of {self._total_pages}  |  Mode: {mode_text}  |  {shortcuts}"
+        if status != self._last_status:
+            self.status_bar.config(text=status)
+            self._last_status = status
 
     def next_page(self):
         """Navigate to next page."""
-        if self.current_page < self.index_data['total_pages'] - 1:
-            self.show_page(self.current_page + 1)
+        self._queue_page_turn(1)
 
     def previous_page(self):
         """Navigate to previous page."""
-        if self.current_page > 0:
-            self.show_page(self.current_page - 1)
+        self._queue_page_turn(-1)
+
+    def _queue_page_turn(self, step: int):
+        """
+        Queue a page turn, to be shown once Tk is idle.
+
+        Key repeat can deliver presses faster than pages are shown; the
+        presses pile up on the queued target, so only the page finally
+        reached is shown.
+
+        Args:
+            step: Pages to move (+1 next, -1 previous)
+        """
+        start = self.current_page if self._pending_page is None else self._pending_page
+        target = start + step
+        if not 0 <= target < self._total_pages:
+            return
+
+        if self._pending_page is None:
+            self.root.after_idle(self._flush_page_turn)
+        self._pending_page = target
+
+    def _flush_page_turn(self):
+        """Show the page reached by the queued page turns."""
+        if self._pending_page is None or self._pending_page == self.current_page:
+            self._pending_page = None
+            return
+        self.show_page(self._pending_page)
 
     def first_page(self):
         """Navigate to first page."""
@@ -297,13 +771,13 @@ class ViewerWindow:
 
     def last_page(self):
         """Navigate to last page."""
-        self.show_page(self.index_data['total_pages'] - 1)
+        self.show_page(self._total_pages - 1)
 
     def goto_page_dialog(self):
         """Show dialog to jump to specific page."""
         from tkinter import simpledialog
 
-        total_pages = self.index_data['total_pages']
+        total_pages = self._total_pages
         current_page = self.current_page + 1  # Convert to 1-based for display
 
         page_num = simpledialog.askinteger(
@@ -419,6 +893,9 @@ TIPS
         Args:
             mode: 'fit-width', 'fit-height', or 'actual'
         """
+        if mode == self.viewing_mode and not self.zoom_mode:
+            return  # Already showing this mode
+
         if mode in ('fit-width', 'fit-height', 'actual'):
             self.viewing_mode = mode
             self.zoom_mode = False  # Exit zoom when switching modes
@@ -426,28 +903,59 @@ TIPS
 
     def _on_window_resize(self, event):
         """Handle window resize events."""
+        # The root binding also sees the canvas's own events; they carry its size
+        if event.widget is self.canvas:
+            self._canvas_dims = (event.width, event.height)
+
         # Only refresh if canvas was resized significantly
         if event.widget == self.root:
+            # Moves and restacking also fire <Configure> - ignore them
+            root_size = (event.width, event.height)
+            if root_size == self._root_size:
+                return
+            self._root_size = root_size
+
+            # The canvas may not have had its own event yet - ask Tk once here
             new_size = (self.canvas.winfo_width(), self.canvas.winfo_height())
+            self._canvas_dims = new_size
 
-            # Check if size changed by more than 10 pixels
-            if (abs(new_size[0] - self.last_window_size[0]) > 10 or
+            # Check if size changed by more than 10 pixels since the last
+            # refresh; while one is pending, every event pushes it back
+            if (self._resize_after_id is not None or
+                    abs(new_size[0] - self.last_window_size[0]) > 10 or
                     abs(new_size[1] - self.last_window_size[1]) > 10):
-                self.last_window_size = new_size
-                # Refresh current page with new size
-                self.show_page(self.current_page)
+                # Dragging fires many events - only rescale once it settles
+                if self._resize_after_id is not None:
+                    self.root.after_cancel(self._resize_after_id)
+                self._resize_after_id = self.root.after(RESIZE_DEBOUNCE_MS, self._do_resize_refresh)
+
+    def _do_resize_refresh(self):
+        """Refresh the current page at the new window size (debounced)."""
+        self._resize_after_id = None
+        self.last_window_size = self._canvas_dims
+        canvas_size = self._canvas_size()
+
+        # Page already rendered for this size - only its layout changes
+        displayed = self._displayed
+        render_key = self._photo_key(self.current_page, self._render_size(canvas_size), None)
+        if displayed is not None and displayed[0][:5] == render_key[:5]:
+            self._display_photo(self.current_photo, displayed[1], canvas_size, None)
+            return
 
-                # If in zoom mode, update scrollbar visibility
-                if self.zoom_mode and self.current_photo:
-                    img_width = self.current_photo.width()
-                    img_height = self.current_photo.height()
-                    self._update_scrollbars(img_width, img_height)
+        # Keep the zoomed view where it was rather than jumping to the top
+        if self._renders_viewport():
+            self._next_view_position = (self.canvas.xview()[0], self.canvas.yview()[0])
+
+        # Refresh current page with new size (also updates scrollbars)
+        self.show_page(self.current_page)
 
     def open_file_browser(self):
         """Open file browser to select a different file."""
         # Save current state
+        self._cancel_state_save()
         try:
-            state_manager.save_state(self.archive_path, self.current_page)
+            state_manager.save_state(self.archive_path, self.current_page,
+                                     self.index_data.get('archive_xxhash'))
         except Exception as e:
             print(f"Warning: Could not save state: {e}")
 
@@ -472,11 +980,19 @@ TIPS
     def quit(self):
         """Close the viewer."""
         # Save final state before quitting
+        self._cancel_state_save()
         try:
-            state_manager.save_state(self.archive_path, self.current_page)
+            state_manager.save_state(self.archive_path, self.current_page,
+                                     self.index_data.get('archive_xxhash'))
         except Exception as e:
             print(f"Warning: Could not save state on exit: {e}")
 
+        # Wait for a running render so it doesn't outlive the image cache
+        if self._render_poll_id is not None:
+            self.root.after_cancel(self._render_poll_id)
+            self._render_poll_id = None
+        self._render_executor.shutdown(wait=True, cancel_futures=True)
+
         self.root.quit()
         self.root.destroy()
 
@@ -490,73 +1006,140 @@ TIPS
         self.root.mainloop()
         return self.switch_to_file
 
-    def _apply_zoom(self, image, zoom_level):
+    def _apply_zoom(self, ladder, zoom_level, canvas_size, interactive=False, view=(0.0, 0.0)):
         """
-        Apply zoom scaling to image.
+        Apply zoom scaling to a page.
 
         Zoom is relative to fit-width size to maintain consistent zoom levels
-        across pages with different image sizes.
+        across pages with different image sizes. Only the part of the zoomed
+        page around the view (plus VIEWPORT_MARGIN) is rendered, so the cost
+        stays proportional to the canvas rather than growing with the zoom.
+
+        Zoomed-out views are scaled from a power-of-two reduction of the page
+        rather than the full resolution. Reductions are made on first use and
+        kept in ladder, so further zoom steps on the page reuse them.
 
         Args:
-            image: PIL Image to zoom
+            ladder: {reduction factor: PIL Image} for the page; 1 is the
+                full-resolution page, other factors are added as needed
             zoom_level: Zoom multiplier (1.0 = 100% = fit-width, 2.0 = 200%)
+            canvas_size: (width, height) of the canvas
+            interactive: Use a quick filter (preview while wheel zooming)
+            view: Scroll position (x, y fractions of the zoomed page) to render around
 
         Returns:
-            Zoomed PIL Image
+            (zoomed PIL Image, placement), where placement is (x, y, page_width,
+            page_height) - the rendered area's offset within the zoomed page,
+            and the zoomed page's full size
         """
-        # First scale to fit-width as the base
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-
-        if canvas_width <= 1:
-            canvas_width = 1200
-        if canvas_height <= 1:
-            canvas_height = 900
+        image = ladder[1]
+        img_width = image.width
+        page_width, page_height = self._zoomed_page_size(image.size, zoom_level, canvas_size)
 
-        # Get fit-width dimensions
-        base_image = self.image_cache.scale_image(image, 'fit-width', (canvas_width, canvas_height))
-        base_width, base_height = base_image.size
+        # Visible area plus margin, clipped to the page
+        x0, y0, x1, y1 = self._viewport_box((page_width, page_height), canvas_size, view)
 
-        # Apply zoom to fit-width size
-        new_width = int(base_width * zoom_level)
-        new_height = int(base_height * zoom_level)
+        # Quick preview while the wheel is turning, full quality once it stops
+        if interactive:
+            resample = Image.Resampling.BILINEAR
+        else:
+            resample = Image.Resampling.LANCZOS
+
+        # Use the smallest reduction that still leaves LANCZOS at least
+        # REDUCING_GAP times the target size - what reducing_gap would do,
+        # without box-reducing the full page again on every zoom step
+        factor = 1
+        while factor * 2 * ImageCache.REDUCING_GAP <= img_width / page_width:
+            factor *= 2
+        source = ladder.get(factor)
+        if source is None:
+            source = image.reduce(factor)
+            ladder[factor] = source
+
+        # Map the area back to source pixels and scale just that part
+        scale_x = source.width / page_width
+        scale_y = source.height / page_height
+        box = (x0 * scale_x, y0 * scale_y, x1 * scale_x, y1 * scale_y)
+        zoomed = source.resize((x1 - x0, y1 - y0), resample, box=box)
+        return self.image_cache.to_display_mode(zoomed), (x0, y0, page_width, page_height)
+
+    @staticmethod
+    def _zoomed_page_size(image_size: Tuple[int, int], zoom_level: float,
+                          canvas_size: Tuple[int, int]) -> Tuple[int, int]:
+        """Return the (width, height) of a page zoomed relative to fit-width."""
+        img_width, img_height = image_size
+        canvas_width = canvas_size[0]
+
+        # Fit-width dimensions, with zoom applied
+        base_height = int(img_height * canvas_width / img_width)
+        return (max(1, int(canvas_width * zoom_level)),
+                max(1, int(base_height * zoom_level)))
+
+    @staticmethod
+    def _viewport_box(page_size: Tuple[int, int], canvas_size: Tuple[int, int],
+                      view: Tuple[float, float]) -> Tuple[int, int, int, int]:
+        """
+        Compute the area of a page to render for a scroll position.
 
-        return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        Args:
+            page_size: (width, height) of the page as displayed
+            canvas_size: (width, height) of the canvas
+            view: Scroll position (x, y fractions of the page)
 
-    def _update_scrollbars(self, img_width, img_height):
+        Returns:
+            (x0, y0, x1, y1) - the visible area plus VIEWPORT_MARGIN, clipped to the page
+        """
+        page_width, page_height = page_size
+        canvas_width, canvas_height = canvas_size
+        margin_x = int(canvas_width * VIEWPORT_MARGIN)
+        margin_y = int(canvas_height * VIEWPORT_MARGIN)
+        left = int(view[0] * page_width)
+        top = int(view[1] * page_height)
+        return (max(0, left - margin_x), max(0, top - margin_y),
+                min(page_width, left + canvas_width + margin_x),
+                min(page_height, top + canvas_height + margin_y))
+
+    def _update_scrollbars(self, img_width, img_height, canvas_size):
         """
         Show/hide scrollbars based on image size vs canvas size.
 
         Args:
             img_width: Width of the displayed image
             img_height: Height of the displayed image
+            canvas_size: (width, height) of the canvas
         """
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-
-        # Unpack both scrollbars first
-        self.v_scrollbar.pack_forget()
-        self.h_scrollbar.pack_forget()
-
-        # Repack canvas to reset layout
-        self.canvas.pack_forget()
+        canvas_width, canvas_height = canvas_size
 
         # Show scrollbars based on need
         needs_vscroll = img_height > canvas_height
         needs_hscroll = img_width > canvas_width
 
-        if needs_vscroll:
-            self.v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        if needs_hscroll:
-            self.h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        # Every pack change costs a geometry pass - only touch the scrollbars
+        # whose visibility changes, and pack them ahead of the canvas so it
+        # never needs repacking (vertical before horizontal, as before)
+        if needs_vscroll != self._vscroll_shown:
+            self._vscroll_shown = needs_vscroll
+            if needs_vscroll:
+                before = self.h_scrollbar if self._hscroll_shown else self.canvas
+                self.v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, before=before)
+            else:
+                self.v_scrollbar.pack_forget()
 
-        # Repack canvas
-        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        if needs_hscroll != self._hscroll_shown:
+            self._hscroll_shown = needs_hscroll
+            if needs_hscroll:
+                self.h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X, before=self.canvas)
+            else:
+                self.h_scrollbar.pack_forget()
 
     def _hide_scrollbars(self):
         """Hide both scrollbars."""
-        self.v_scrollbar.pack_forget()
-        self.h_scrollbar.pack_forget()
+        if self._vscroll_shown:
+            self.v_scrollbar.pack_forget()
+            self._vscroll_shown = False
+        if self._hscroll_shown:
+            self.h_scrollbar.pack_forget()
+            self._hscroll_shown = False
 
     def toggle_zoom_mode(self):
         """Toggle zoom mode on/off."""
@@ -575,47 +1158,108 @@ TIPS
         if not self.zoom_mode:
             self.toggle_zoom_mode()
 
-        self.zoom_level = min(self.zoom_level + 0.25, self.max_zoom)
-        self.show_page(self.current_page)
+        zoom_level = min(self.zoom_level + 0.25, self.max_zoom)
+        if zoom_level == self.zoom_level:
+            return  # Already at maximum zoom
+        self.zoom_level = zoom_level
+        self._render_current()
+        self._update_status()
 
     def zoom_out(self):
         """Decrease zoom level by 25%."""
         if not self.zoom_mode:
             self.toggle_zoom_mode()
 
-        self.zoom_level = max(self.zoom_level - 0.25, self.min_zoom)
-        self.show_page(self.current_page)
+        zoom_level = max(self.zoom_level - 0.25, self.min_zoom)
+        if zoom_level == self.zoom_level:
+            return  # Already at minimum zoom
+        self.zoom_level = zoom_level
+        self._render_current()
+        self._update_status()
 
     def reset_zoom(self):
         """Reset zoom to 100% and center."""
+        if self.zoom_mode and self.zoom_level == 1.0:
+            # Page is already rendered at 100% - just center the view
+            self.canvas.xview_moveto(0.25)
+            self.canvas.yview_moveto(0.25)
+            return
+
         if not self.zoom_mode:
             self.toggle_zoom_mode()
 
         self.zoom_level = 1.0
-        self.show_page(self.current_page)
-        # Center the view
-        self.canvas.xview_moveto(0.25)
-        self.canvas.yview_moveto(0.25)
+        # Center the view once the page is shown
+        self._next_view_position = (0.25, 0.25)
+        self._render_current()
+        self._update_status()
 
     def _on_ctrl_wheel(self, event):
         """Handle Ctrl+MouseWheel for continuous zoom."""
         if not self.zoom_mode:
             self.toggle_zoom_mode()
 
-        # Detect scroll direction (cross-platform)
-        if hasattr(event, 'delta'):
-            delta = event.delta
-        else:
-            # Linux: Button-4 is scroll up, Button-5 is scroll down
-            delta = 1 if event.num == 4 else -1
-
         # Zoom in/out by 10% per wheel notch
-        if delta > 0:
-            self.zoom_level = min(self.zoom_level * 1.1, self.max_zoom)
+        if self._wheel_direction(event) > 0:
+            zoom_level = min(self.zoom_level * 1.1, self.max_zoom)
         else:
-            self.zoom_level = max(self.zoom_level / 1.1, self.min_zoom)
+            zoom_level = max(self.zoom_level / 1.1, self.min_zoom)
+        if zoom_level == self.zoom_level:
+            return  # Already at the zoom limit
+        self.zoom_level = zoom_level
+
+        # Render a bilinear preview now; re-render with LANCZOS once the wheel stops
+        self._zoom_is_interactive = True
+        if self._zoom_finalize_after_id is not None:
+            self.root.after_cancel(self._zoom_finalize_after_id)
+        self._zoom_finalize_after_id = self.root.after(ZOOM_FINALIZE_MS, self._finalize_zoom)
+
+        # Coalesce a burst of notches into a single render at the final level
+        if not self._zoom_render_scheduled:
+            self._zoom_render_scheduled = True
+            self.root.after_idle(self._flush_zoom)
+
+    def _flush_zoom(self):
+        """Render the zoom level reached by the wheel notches since the last render."""
+        if not self._zoom_render_scheduled:
+            return
+        self._zoom_render_scheduled = False
+        if self.zoom_mode:
+            if self._zoom_changes_page_size():
+                self._render_current()
+            self._update_status()
 
-        self.show_page(self.current_page)
+    def _zoom_changes_page_size(self) -> bool:
+        """
+        Check whether the zoom level gives a different page size than the one shown.
+
+        Steps too small to change the zoomed page by a pixel (e.g. near the
+        zoom limits) don't need a render - unless another zoom level is still
+        rendering, which would otherwise replace the page on screen.
+        """
+        if self._pending_render is not None:
+            return True
+
+        displayed = self._displayed
+        with self._native_lock:
+            native = self._native_image
+        if displayed is None or native is None:
+            return True
+        photo_key, placement = displayed
+        render_size = self._render_size(self._canvas_size())
+        if (not photo_key[1] or photo_key[0] != self.current_page
+                or native[0] != self.current_page or photo_key[3:5] != render_size):
+            return True
+        page_size = self._zoomed_page_size(native[1][1].size, self.zoom_level, render_size)
+        return page_size != placement[2:]
+
+    def _finalize_zoom(self):
+        """Re-render the current page at full quality after wheel zooming."""
+        self._zoom_finalize_after_id = None
+        self._zoom_is_interactive = False
+        if self.zoom_mode:
+            view = (self.canvas.xview()[0], self.canvas.yview()[0])
+            self._render_current(view=view)
 
     def _handle_a_key(self):
         """Handle 'a' key - actual size mode or pan left depending on zoom mode."""
@@ -648,43 +1292,38 @@ TIPS
             return
         self.canvas.xview_scroll(5, tk.UNITS)
 
+    @staticmethod
+    def _wheel_direction(event) -> int:
+        """
+        Normalize a wheel event to a direction.
+
+        Windows/Mac report a signed delta (+/- 120 per notch); X11 sends
+        Button-4/5 events whose delta is 0.
+
+        Returns:
+            1 for wheel up/away, -1 for down/towards
+        """
+        delta = event.delta
+        if delta:
+            return 1 if delta > 0 else -1
+        return WHEEL_BUTTON_DIRECTIONS.get(event.num, -1)
+
     def _on_mouse_wheel(self, event):
         """Handle mouse wheel for vertical scrolling when zoomed."""
-        # Check if scrolling is active (based on scrollregion, not zoom mode)
-        scrollregion = self.canvas.cget('scrollregion')
-        # scrollregion is empty string '' when not set, or '0 0 0 0' when disabled
-        if not scrollregion or scrollregion == '' or scrollregion == '0 0 0 0':
+        # Check if scrolling is active (set by the page layout, not zoom mode)
+        if self._rendered_region is None:
             return "break"  # No scrolling active
 
-        # Detect scroll direction (cross-platform)
-        if hasattr(event, 'delta') and event.delta != 0:
-            # Windows/Mac: delta is +/- 120
-            delta = event.delta
-            scroll_amount = 1 if delta > 0 else -1
-        else:
-            # Linux touchpad: Button-4 is scroll up, Button-5 is scroll down
-            # Traditional scrolling (not inverted)
-            scroll_amount = -1 if event.num == 4 else 1
-
-        self.canvas.yview_scroll(scroll_amount, tk.UNITS)
+        # Traditional scrolling (not inverted): wheel up scrolls up
+        self.canvas.yview_scroll(-self._wheel_direction(event), tk.UNITS)
         return "break"  # Prevent event propagation
 
     def _on_shift_wheel(self, event):
         """Handle Shift+MouseWheel for horizontal scrolling when zoomed."""
-        # Check if scrolling is active (based on scrollregion, not zoom mode)
-        scrollregion = self.canvas.cget('scrollregion')
-        # scrollregion is empty string '' when not set, or '0 0 0 0' when disabled
-        if not scrollregion or scrollregion == '' or scrollregion == '0 0 0 0':
+        # Check if scrolling is active (set by the page layout, not zoom mode)
+        if self._rendered_region is None:
             return "break"  # No scrolling active
 
-        # Detect scroll direction (cross-platform)
-        if hasattr(event, 'delta') and event.delta != 0:
-            delta = event.delta
-            scroll_amount = -1 if delta > 0 else 1
-        else:
-            # Linux touchpad: Button-4 is scroll up (left), Button-5 is scroll down (right)
-            # Traditional scrolling (not inverted)
-            scroll_amount = -1 if event.num == 4 else 1
-
-        self.canvas.xview_scroll(scroll_amount, tk.UNITS)
+        # Traditional scrolling (not inverted): wheel up scrolls left
+        self.canvas.xview_scroll(-self._wheel_direction(event), tk.UNITS)
         return "break"  # Prevent event propagation